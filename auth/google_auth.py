@@ -1,12 +1,15 @@
 # auth/google_auth.py
 
 import asyncio
+import hashlib
 import json
 import jwt
 import logging
 import os
+import threading
 import time
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, Dict, Any
 
@@ -14,7 +17,10 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import build_http
 from googleapiclient.errors import HttpError
 from auth.scopes import OAUTH_STATE_TO_SESSION_ID_MAP, SCOPES
 
@@ -58,6 +64,49 @@ else:
         "client_secret.json",
     )
 
+
+class _ThreadLocalHttp:
+    """
+    httplib2.Http stand-in that keeps a separate connection pool per thread.
+
+    httplib2.Http is not thread-safe, but API calls run on a fixed pool of worker
+    threads. Giving each thread its own Http lets keep-alive connections (and their
+    TLS sessions) be reused across tool calls without two calls sharing a socket.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = build_http()
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._http(), name)
+
+
+# Shared by every service built in build_authenticated_service
+_POOLED_HTTP = _ThreadLocalHttp()
+
+# Parsed copies of the discovery documents bundled with google-api-python-client,
+# keyed by (service name, version), so building a service skips the file read and
+# JSON parse that build() repeats every time
+_DISCOVERY_DOCS: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+# Header and environment credentials that get_credentials has already refreshed,
+# keyed by (source, secret digest, sorted scopes). Reused until close to expiry so
+# each tool call doesn't force another token refresh; least recently used entries
+# are evicted beyond the cap.
+_RESOLVED_CREDENTIALS_CACHE: "OrderedDict[Tuple[Any, ...], Credentials]" = OrderedDict()
+_RESOLVED_CREDENTIALS_MAX_ENTRIES = 256
+# get_credentials runs on worker threads
+_RESOLVED_CREDENTIALS_LOCK = threading.Lock()
+
 # --- Helper Functions ---
 
 
@@ -79,6 +128,52 @@ def _is_token_expiring_soon(credentials: Credentials, minutes_threshold: int = 5
     return credentials.expiry <= expiry_threshold
 
 
+def _get_discovery_doc(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed static discovery document for an API, or None if none is bundled."""
+    key = (service_name, version)
+    doc = _DISCOVERY_DOCS.get(key)
+    if doc is None:
+        content = get_static_doc(service_name, version)
+        if content is None:
+            return None
+        doc = _DISCOVERY_DOCS[key] = json.loads(content)
+    return doc
+
+
+def warm_discovery_documents(services: List[Tuple[str, str]]) -> None:
+    """Load discovery documents at startup so the first tool call for each API doesn't pay for parsing."""
+    for service_name, version in services:
+        if _get_discovery_doc(service_name, version) is None:
+            logger.warning(f"No bundled discovery document for {service_name} {version}")
+
+
+def _secret_digest(*parts: str) -> str:
+    """Hash secret values into a cache key component so the secrets themselves aren't held as keys."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _get_resolved_credentials(cache_key: Tuple[Any, ...]) -> Optional[Credentials]:
+    """Return previously refreshed credentials for cache_key if they are still comfortably valid."""
+    with _RESOLVED_CREDENTIALS_LOCK:
+        credentials = _RESOLVED_CREDENTIALS_CACHE.get(cache_key)
+        if credentials is None:
+            return None
+        if credentials.valid and not _is_token_expiring_soon(credentials):
+            _RESOLVED_CREDENTIALS_CACHE.move_to_end(cache_key)
+            return credentials
+        del _RESOLVED_CREDENTIALS_CACHE[cache_key]
+        return None
+
+
+def _cache_resolved_credentials(cache_key: Tuple[Any, ...], credentials: Credentials) -> None:
+    """Remember refreshed credentials, evicting the least recently used entry when full."""
+    with _RESOLVED_CREDENTIALS_LOCK:
+        _RESOLVED_CREDENTIALS_CACHE[cache_key] = credentials
+        _RESOLVED_CREDENTIALS_CACHE.move_to_end(cache_key)
+        while len(_RESOLVED_CREDENTIALS_CACHE) > _RESOLVED_CREDENTIALS_MAX_ENTRIES:
+            _RESOLVED_CREDENTIALS_CACHE.popitem(last=False)
+
+
 def _refresh_credentials_if_needed(
     credentials: Credentials,
     session_id: Optional[str],
@@ -761,7 +856,7 @@ def validate_environment_credentials() -> Tuple[bool, List[str]]:
     
     if scopes_str:
         scopes = [scope.strip() for scope in scopes_str.split(",")]
-        if not scopes or any(not scope for scope in scopes):
+        if "" in scopes:
             errors.append("GOOGLE_OAUTH_SCOPES must be a comma-separated list of non-empty scopes")
     
     # Validate access token format if provided
@@ -1107,9 +1202,16 @@ def get_credentials(
     Returns:
         Valid Credentials object or None.
     """
+    scopes_key = tuple(sorted(required_scopes))
+
     # Priority 1: Try to create credentials from header parameters first
     if client_id and client_secret and refresh_token:
-        
+        header_cache_key = ("header", _secret_digest(client_id, client_secret, refresh_token), scopes_key)
+        cached_credentials = _get_resolved_credentials(header_cache_key)
+        if cached_credentials:
+            logger.debug(f"[get_credentials] Reusing refreshed header credentials. Session: '{session_id}'")
+            return cached_credentials
+
         try:
             header_credentials = Credentials(
                 token=None,  # Will be refreshed if needed
@@ -1133,6 +1235,7 @@ def get_credentials(
                 logger.info(
                     f"[get_credentials] Successfully using header credentials. User: '{user_google_email}', Session: '{session_id}'"
                 )
+                _cache_resolved_credentials(header_cache_key, refreshed_credentials)
                 return refreshed_credentials
             else:
                 logger.warning(
@@ -1146,6 +1249,12 @@ def get_credentials(
             # Fall through to other methods
     
     # Priority 2: Try to load from environment variables
+    env_cache_key = ("env", scopes_key)
+    cached_credentials = _get_resolved_credentials(env_cache_key)
+    if cached_credentials:
+        logger.debug(f"[get_credentials] Reusing refreshed environment credentials. Session: '{session_id}'")
+        return cached_credentials
+
     env_credentials = load_credentials_from_env()
     if env_credentials:
         logger.info(
@@ -1191,6 +1300,7 @@ def get_credentials(
                 logger.info(
                     f"[get_credentials] Successfully using environment credentials. User: '{user_google_email}', Session: '{session_id}'"
                 )
+                _cache_resolved_credentials(env_cache_key, refreshed_credentials)
                 return refreshed_credentials
             else:
                 logger.warning(
@@ -1336,34 +1446,40 @@ class GoogleAuthenticationError(Exception):
         self.auth_url = auth_url
 
 
-async def get_authenticated_google_service(
-    service_name: str,  # "gmail", "calendar", "drive", "docs"
-    version: str,  # "v1", "v3"
-    tool_name: str,  # For logging/debugging
+def credential_identity(credentials: Credentials) -> str:
+    """
+    Identify the account credentials act for, without exposing their secrets.
+
+    Credentials minted from the same client and refresh token share an identity,
+    so it can key per-account caches and quotas.
+    """
+    return _secret_digest(
+        credentials.client_id or "",
+        credentials.refresh_token or credentials.token or "",
+    )[:32]
+
+
+async def get_authenticated_credentials(
+    service_name: str,
+    tool_name: str,
     required_scopes: List[str],
     client_id: Optional[str] = None,
     client_secret: Optional[str] = None,
     refresh_token: Optional[str] = None,
-) -> tuple[Any, str]:
+) -> Credentials:
     """
-    Centralized Google service authentication for all MCP tools.
-    Returns (service, user_email) on success or raises GoogleAuthenticationError.
+    Resolve valid credentials for a tool call, or raise GoogleAuthenticationError with an auth URL.
 
     Args:
-        service_name: The Google service name ("gmail", "calendar", "drive", "docs")
-        version: The API version ("v1", "v3", etc.)
+        service_name: The Google service name, used in the auth prompt
         tool_name: The name of the calling tool (for logging/debugging)
-        user_google_email: The user's Google email address (required)
         required_scopes: List of required OAuth scopes
         client_id: OAuth client ID from headers (optional)
         client_secret: OAuth client secret from headers (optional)
         refresh_token: OAuth refresh token from headers (optional)
 
     Returns:
-        tuple[service, user_email] on success
-
-    Raises:
-        GoogleAuthenticationError: When authentication is required or fails
+        Valid Credentials, from headers, environment or storage
     """
     logger.info(
         f"[{tool_name}] Attempting to get authenticated {service_name} service."
@@ -1410,8 +1526,34 @@ async def get_authenticated_google_service(
         # Extract the auth URL from the response and raise with it
         raise GoogleAuthenticationError(auth_response)
 
+    return credentials
+
+
+def build_authenticated_service(
+    credentials: Credentials,
+    service_name: str,
+    version: str,
+    tool_name: str,
+) -> tuple[Any, str]:
+    """
+    Build a Google API service client on resolved credentials.
+
+    Returns:
+        tuple[service, user_email]; user_email comes from the id_token when present
+
+    Raises:
+        GoogleAuthenticationError: When the service cannot be built
+    """
     try:
-        service = build(service_name, version, credentials=credentials)
+        # Use the discovery documents bundled with google-api-python-client so
+        # building a service never waits on a network fetch. Requests go through
+        # the per-thread connection pools so TLS sessions survive between calls.
+        http = AuthorizedHttp(credentials, http=_POOLED_HTTP)
+        discovery_doc = _get_discovery_doc(service_name, version)
+        if discovery_doc is not None:
+            service = build_from_document(discovery_doc, http=http)
+        else:
+            service = build(service_name, version, http=http, static_discovery=True)
         log_user_email = None
 
         # Try to get email from credentials if needed for validation
@@ -1437,3 +1579,43 @@ async def get_authenticated_google_service(
         error_msg = f"[{tool_name}] Failed to build {service_name} service: {str(e)}"
         logger.error(error_msg, exc_info=True)
         raise GoogleAuthenticationError(error_msg)
+
+
+async def get_authenticated_google_service(
+    service_name: str,  # "gmail", "calendar", "drive", "docs"
+    version: str,  # "v1", "v3"
+    tool_name: str,  # For logging/debugging
+    required_scopes: List[str],
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None,
+    refresh_token: Optional[str] = None,
+) -> tuple[Any, str]:
+    """
+    Centralized Google service authentication for all MCP tools.
+    Returns (service, user_email) on success or raises GoogleAuthenticationError.
+
+    Args:
+        service_name: The Google service name ("gmail", "calendar", "drive", "docs")
+        version: The API version ("v1", "v3", etc.)
+        tool_name: The name of the calling tool (for logging/debugging)
+        user_google_email: The user's Google email address (required)
+        required_scopes: List of required OAuth scopes
+        client_id: OAuth client ID from headers (optional)
+        client_secret: OAuth client secret from headers (optional)
+        refresh_token: OAuth refresh token from headers (optional)
+
+    Returns:
+        tuple[service, user_email] on success
+
+    Raises:
+        GoogleAuthenticationError: When authentication is required or fails
+    """
+    credentials = await get_authenticated_credentials(
+        service_name=service_name,
+        tool_name=tool_name,
+        required_scopes=required_scopes,
+        client_id=client_id,
+        client_secret=client_secret,
+        refresh_token=refresh_token,
+    )
+    return build_authenticated_service(credentials, service_name, version, tool_name)
@@ -1,12 +1,17 @@
 import inspect
 import logging
+from collections import OrderedDict
 from functools import wraps
 from typing import Dict, List, Optional, Any, Callable, Union
 from datetime import datetime, timedelta
 
 from fastmcp import Context
 from google.auth.exceptions import RefreshError
-from auth.google_auth import get_authenticated_google_service, GoogleAuthenticationError
+from auth.google_auth import (
+    get_authenticated_credentials, build_authenticated_service,
+    credential_identity, GoogleAuthenticationError,
+)
+from core.utils import current_credential_identity
 
 logger = logging.getLogger(__name__)
 
@@ -81,15 +86,16 @@ SCOPE_GROUPS = {
     "tasks_read": TASKS_READONLY_SCOPE,
 }
 
-# Service cache: {cache_key: (service, cached_time, user_email)}
-_service_cache: Dict[str, tuple[Any, datetime, str]] = {}
+# Service cache: {cache_key: (service, cached_time, user_email)}, least recently used first
+_service_cache: "OrderedDict[str, tuple[Any, datetime, str]]" = OrderedDict()
 _cache_ttl = timedelta(minutes=30)  # Cache services for 30 minutes
+_cache_max_entries = 256
 
 
-def _get_cache_key(user_email: str, service_name: str, version: str, scopes: List[str]):
-    """Generate a cache key for service instances."""
+def _get_cache_key(identity: str, service_name: str, version: str, scopes: List[str]):
+    """Generate a cache key for service instances built on the credentials with this identity."""
     sorted_scopes = sorted(scopes)
-    return f"{user_email}:{service_name}:{version}:{':'.join(sorted_scopes)}"
+    return f"{identity}:{service_name}:{version}:{':'.join(sorted_scopes)}"
 
 
 def _is_cache_valid(cached_time: datetime) -> bool:
@@ -103,6 +109,7 @@ def _get_cached_service(cache_key: str) -> Optional[tuple[Any, str]]:
         service, cached_time, user_email = _service_cache[cache_key]
         if _is_cache_valid(cached_time):
             logger.debug(f"Using cached service for key: {cache_key}")
+            _service_cache.move_to_end(cache_key)
             return service, user_email
         else:
             # Remove expired cache entry
@@ -114,6 +121,9 @@ def _get_cached_service(cache_key: str) -> Optional[tuple[Any, str]]:
 def _cache_service(cache_key: str, service: Any, user_email: str) -> None:
     """Cache a service instance."""
     _service_cache[cache_key] = (service, datetime.now(), user_email)
+    _service_cache.move_to_end(cache_key)
+    while len(_service_cache) > _cache_max_entries:
+        _service_cache.popitem(last=False)
     logger.debug(f"Cached service for key: {cache_key}")
 
 
@@ -267,39 +277,50 @@ def require_google_service(
 
             # --- Service Caching and Authentication Logic (largely unchanged) ---
             service = None
-            # actual_user_email = user_google_email
-            #
-            # if cache_enabled:
-            #     cache_key = _get_cache_key(user_google_email, service_name, service_version, resolved_scopes)
-            #     cached_result = _get_cached_service(cache_key)
-            #     if cached_result:
-            #         service, actual_user_email = cached_result
-
-            if service is None:
-                try:
-                    tool_name = func.__name__
-                    service, actual_user_email = await get_authenticated_google_service(
-                        service_name=service_name,
-                        version=service_version,
-                        tool_name=tool_name,
-                        required_scopes=resolved_scopes,
-                        client_id=client_id,
-                        client_secret=client_secret,
-                        refresh_token=refresh_token,
+            cache_key = None
+            try:
+                tool_name = func.__name__
+                credentials = await get_authenticated_credentials(
+                    service_name=service_name,
+                    tool_name=tool_name,
+                    required_scopes=resolved_scopes,
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    refresh_token=refresh_token,
+                )
+                # Cached services keep their credentials, which refresh themselves on
+                # expiry, and their requests share the per-thread connection pools.
+                # Key on the credentials actually resolved, so a header request that
+                # fell back to other credentials never reuses a service built on them.
+                if cache_enabled:
+                    cache_key = _get_cache_key(credential_identity(credentials), service_name, service_version, resolved_scopes)
+                    cached_result = _get_cached_service(cache_key)
+                    if cached_result:
+                        service, actual_user_email = cached_result
+
+                if service is None:
+                    service, actual_user_email = build_authenticated_service(
+                        credentials, service_name, service_version, tool_name
                     )
-                    # if cache_enabled:
-                    #     cache_key = _get_cache_key(user_google_email, service_name, service_version, resolved_scopes)
-                    #     _cache_service(cache_key, service, actual_user_email)
-                except GoogleAuthenticationError as e:
-                    raise Exception(str(e))
+                    if cache_key:
+                        _cache_service(cache_key, service, actual_user_email)
+            except GoogleAuthenticationError as e:
+                raise Exception(str(e))
 
             # --- Call the original function with the service object injected ---
+            # Per-account rate limits and caches below key on these credentials
+            identity_token = current_credential_identity.set(credential_identity(credentials))
             try:
                 # Prepend the fetched service object to the original arguments
                 return await func(service, *args, **kwargs)
             except RefreshError as e:
                 # error_message = _handle_token_refresh_error(e, service_name)
+                if cache_key:
+                    # Don't keep serving a service whose token can no longer refresh
+                    _service_cache.pop(cache_key, None)
                 raise Exception(f"refresh error") from e
+            finally:
+                current_credential_identity.reset(identity_token)
 
         # Set the wrapper's signature to the one without 'service'
         wrapper.__signature__ = wrapper_sig
@@ -383,6 +404,7 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
                 else:
                     logger.debug(f"[{func.__name__}] No complete OAuth credentials found in headers")
 
+            credentials = None
             for config in service_configs:
                 service_type = config["service_type"]
                 scopes = config["scopes"]
@@ -399,15 +421,17 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
 
                 try:
                     tool_name = func.__name__
-                    service, _ = await get_authenticated_google_service(
+                    credentials = await get_authenticated_credentials(
                         service_name=service_name,
-                        version=service_version,
                         tool_name=tool_name,
                         required_scopes=resolved_scopes,
                         client_id=client_id,
                         client_secret=client_secret,
                         refresh_token=refresh_token,
                     )
+                    service, _ = build_authenticated_service(
+                        credentials, service_name, service_version, tool_name
+                    )
 
                     # Inject service with specified parameter name
                     kwargs[param_name] = service
@@ -416,12 +440,15 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
                     raise Exception(str(e))
 
             # Call the original function with refresh error handling
+            identity_token = current_credential_identity.set(credential_identity(credentials) if credentials else None)
             try:
                 return await func(*args, **kwargs)
             except RefreshError as e:
                 # Handle token refresh errors gracefully
                 # error_message = _handle_token_refresh_error(e, user_google_email, "Multiple Services")
                 raise Exception(str(e))
+            finally:
+                current_credential_identity.reset(identity_token)
 
         return wrapper
     return decorator
@@ -445,7 +472,7 @@ def clear_service_cache(user_email: Optional[str] = None) -> int:
         logger.info(f"Cleared all {count} service cache entries")
         return count
 
-    keys_to_remove = [key for key in _service_cache.keys() if key.startswith(f"{user_email}:")]
+    keys_to_remove = [key for key, (_, _, cached_email) in _service_cache.items() if cached_email == user_email]
     for key in keys_to_remove:
         del _service_cache[key]
 
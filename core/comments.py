@@ -7,6 +7,7 @@ All Google Workspace apps (Docs, Sheets, Slides) use the Drive API for comment o
 
 import logging
 import asyncio
+import functools
 from typing import Dict, Any, Optional
 
 from mcp import types
@@ -20,10 +21,14 @@ from core.utils import handle_http_errors
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def create_comment_tools(app_name: str, file_id_param: str):
     """
     Factory function to create comment management tools for a specific Google Workspace app.
 
+    Results are cached per (app_name, file_id_param), so re-importing or reloading a
+    tool module reuses the already-registered tools instead of registering them again.
+
     Args:
         app_name: Name of the app (e.g., "document", "spreadsheet", "presentation")
         file_id_param: Parameter name for the file ID (e.g., "document_id", "spreadsheet_id", "presentation_id")
@@ -1,13 +1,41 @@
+import asyncio
+import contextvars
+import functools
 import io
 import logging
 import os
+import random
 import tempfile
+import time
 import zipfile, xml.etree.ElementTree as ET
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
+from googleapiclient.errors import HttpError
+
 logger = logging.getLogger(__name__)
 
+# Local file header signature that every OOXML (zip) container starts with
+_ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Drive query string literals need both backslashes and single quotes escaped
+_DRIVE_QUERY_TRANSLATE = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+
+def escape_drive_query(value: str) -> str:
+    """
+    Escape a value for use inside a single-quoted Drive API query literal.
+
+    Args:
+        value: Raw user-supplied text
+
+    Returns:
+        str: The text with backslashes and single quotes escaped
+    """
+    return value.translate(_DRIVE_QUERY_TRANSLATE)
+
 def check_credentials_directory_permissions(credentials_dir: str = None) -> None:
     """
     Check if the service has appropriate permissions to create and write to the .credentials directory.
@@ -65,6 +93,10 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
     Returns plain-text if something readable is found, else None.
     No external deps – just std-lib zipfile + ElementTree.
     """
+    if not file_bytes.startswith(_ZIP_SIGNATURE):
+        logger.warning(f"File is not a valid ZIP archive (mime_type: {mime_type}).")
+        return None
+
     shared_strings: List[str] = []
     ns_excel_main = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
 
@@ -160,8 +192,127 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
         logger.error(f"Failed to extract office XML text for {mime_type}: {e}", exc_info=True)
         return None
 
-import functools
-from googleapiclient.errors import HttpError
+
+# Identity (see auth.google_auth.credential_identity) of the credentials the current
+# tool call runs with; set by the auth.service_decorator decorators
+current_credential_identity: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_credential_identity", default=None
+)
+
+# Dedicated pool for blocking googleapiclient calls, so slow API requests don't
+# queue behind (or starve) other users of the event loop's default executor
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gapi")
+
+
+async def run_api_call(func, /, *args, **kwargs):
+    """
+    Run a blocking Google API call on the shared API executor.
+
+    Drop-in replacement for asyncio.to_thread: the current context is propagated
+    so request-scoped context variables remain visible inside the call.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_API_EXECUTOR, functools.partial(ctx.run, func, *args, **kwargs))
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for pacing API requests from coroutines.
+
+    Allows bursts of up to max_rate requests, refilling at max_rate per time_period
+    seconds. Callers over the limit wait for a token instead of drawing a 429.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self._capacity = max_rate
+        self._tokens = max_rate
+        self._fill_rate = max_rate / time_period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, cost: float = 1) -> None:
+        """Wait until cost tokens are available and consume them."""
+        # A request larger than the bucket could never be satisfied; let it drain the bucket instead
+        cost = min(cost, self._capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                await asyncio.sleep((cost - self._tokens) / self._fill_rate)
+
+
+# Per-account limiters, keyed by (bucket, credential identity); created on first use
+# and evicted least recently used first beyond the cap
+_USER_RATE_LIMITERS: "OrderedDict[tuple, AsyncRateLimiter]" = OrderedDict()
+_USER_RATE_LIMITERS_MAX_ENTRIES = 1024
+
+
+def get_user_rate_limiter(bucket: str, identity: Optional[str], max_rate: float, time_period: float = 60.0) -> AsyncRateLimiter:
+    """Return the limiter for one account's share of a quota bucket, creating it on first use."""
+    key = (bucket, identity or "")
+    limiter = _USER_RATE_LIMITERS.get(key)
+    if limiter is None:
+        limiter = _USER_RATE_LIMITERS[key] = AsyncRateLimiter(max_rate, time_period)
+        while len(_USER_RATE_LIMITERS) > _USER_RATE_LIMITERS_MAX_ENTRIES:
+            _USER_RATE_LIMITERS.popitem(last=False)
+    else:
+        _USER_RATE_LIMITERS.move_to_end(key)
+    return limiter
+
+
+# Times a tool rejected with 429 is retried before the error is surfaced
+_MAX_RATE_LIMIT_RETRIES = 3
+
+
+def rate_limit_retry_delay(error: HttpError, attempt: int) -> float:
+    """Seconds to wait before retrying a 429: the server's Retry-After if given, else exponential backoff."""
+    retry_after = error.resp.get("retry-after")
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = 2 ** attempt
+    return delay + random.uniform(0, 1)
+
+
+def rate_limited(bucket: str, max_rate: float, time_period: float = 60.0, cost=1):
+    """
+    A decorator that paces a tool against a per-user quota before it runs.
+
+    Concurrent calls for the same account and bucket queue on a shared token bucket
+    instead of bursting past the API's per-user quota and drawing 429s. Accounts
+    are told apart by the credentials the call resolved, so it must sit below
+    require_google_service. A call the API still rejects with 429 (its quota is
+    shared with other clients) is retried with backoff, drawing from the bucket again.
+
+    Args:
+        bucket (str): Quota bucket name (e.g., 'sheets_write'); tools sharing a bucket share a limit.
+        max_rate (float): Quota units allowed per time_period for each user.
+        time_period (float): Length of the quota window in seconds. Defaults to 60.
+        cost: Units one call consumes, or a callable taking the call's kwargs and returning them.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            units = cost(kwargs) if callable(cost) else cost
+            limiter = get_user_rate_limiter(bucket, current_credential_identity.get(), max_rate, time_period)
+            for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+                await limiter.acquire(units)
+                try:
+                    return await func(*args, **kwargs)
+                except HttpError as error:
+                    if error.resp.status != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                        raise
+                    delay = rate_limit_retry_delay(error, attempt)
+                    logger.warning(f"[{func.__name__}] Rate limited by the API, retrying in {delay:.1f}s (attempt {attempt + 1}/{_MAX_RATE_LIMIT_RETRIES})")
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
 
 def handle_http_errors(tool_name: str):
     """
@@ -7,9 +7,11 @@ import logging
 import asyncio
 import io
 import json
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any, Union, Literal
 from uuid import uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from mcp import types
 from fastmcp import Context
@@ -17,12 +19,51 @@ from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload, HttpReq
 
 # Auth & server utilities
 from auth.service_decorator import require_google_service, require_multiple_services
-from core.utils import extract_office_xml_text, handle_http_errors
+from core.utils import escape_drive_query, extract_office_xml_text, handle_http_errors, run_api_call
 from core.server import server
 from core.comments import create_comment_tools
 
 logger = logging.getLogger(__name__)
 
+# Drive downloads are pulled in large chunks on their own executor so slow
+# transfers don't tie up the default executor used by other API calls
+_DOWNLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+_DOWNLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gdocs-download")
+
+# Drive file types handled by extract_office_xml_text
+_OFFICE_MIME_TYPES = frozenset({
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+})
+# Drive file types that are never worth attempting to decode as text
+_BINARY_MIME_PREFIXES = ("image/", "audio/", "video/", "application/pdf", "application/zip")
+
+# Shared Drive files.list query suffix and field masks for the Docs listing tools
+_DOCS_QUERY_SUFFIX = " and mimeType='application/vnd.google-apps.document' and trashed=false"
+_SEARCH_DOCS_FIELDS = "files(id, name, createdTime, modifiedTime, webViewLink)"
+_LIST_DOCS_FIELDS = "files(id, name, modifiedTime, webViewLink)"
+
+# Docs API field mask limited to what get_doc_content reads. Only the structural
+# element kinds process_structural_elements handles are requested; table cell
+# content is left unmasked so nested tables come back whole.
+_DOC_BODY_FIELDS = (
+    "body/content(paragraph/elements(textRun/content,inlineObjectElement/inlineObjectId),"
+    "table/tableRows/tableCells/content,sectionBreak,tableOfContents)"
+)
+# Docs nests tabs at most three levels deep
+_DOC_TAB_DEPTH = 3
+
+def _build_doc_field_mask() -> str:
+    """Build the get_doc_content field mask, spelling out childTabs for each nesting level."""
+    tab_fields = f"tabProperties(tabId,title),documentTab/{_DOC_BODY_FIELDS}"
+    nested = tab_fields
+    for _ in range(_DOC_TAB_DEPTH - 1):
+        nested = f"{tab_fields},childTabs({nested})"
+    return f"inlineObjects,{_DOC_BODY_FIELDS},tabs({nested})"
+
+_DOC_FIELD_MASK = _build_doc_field_mask()
+
 # ==================== Pydantic Models for Structured Output ====================
 
 class TextElement(BaseModel):
@@ -62,6 +103,8 @@ class TableBlock(BaseModel):
 
 class StructuralBlock(BaseModel):
     """Represents structural elements like breaks and rules"""
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["section_break", "page_break", "horizontal_rule", "table_of_contents"] = Field(description="Block type")
 
 class HeaderFooterBlock(BaseModel):
@@ -131,6 +174,12 @@ class ListDocsResponse(BaseModel):
     total_found: int = Field(description="Number of documents found")
     documents: List[DocReference] = Field(default_factory=list, description="List of document references")
 
+class ListDocsInFoldersResponse(BaseModel):
+    """Response for listing documents across several folders"""
+    total_folders: int = Field(description="Number of folders requested")
+    folders: List[ListDocsResponse] = Field(default_factory=list, description="Per-folder document listings")
+    errors: List[Dict[str, str]] = Field(default_factory=list, description="Folders that could not be listed")
+
 class CreateDocResponse(BaseModel):
     """Response for document creation"""
     success: bool = Field(description="Whether the document was created successfully")
@@ -152,13 +201,29 @@ class InsertMarkdownResponse(BaseModel):
 
 # ==================== Helper Functions ====================
 
+# Shared read-only fallback for missing Docs API sub-objects, avoiding a fresh {} per miss
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Structural elements that carry no content of their own, keyed by their Docs API field
+_STRUCTURAL_BLOCK_TYPES = {
+    'sectionBreak': 'section_break',
+    'tableOfContents': 'table_of_contents',
+    'pageBreak': 'page_break',
+    'horizontalRule': 'horizontal_rule',
+}
+# StructuralBlock is frozen and carries only its type, so one instance per type is shared
+_STRUCTURAL_BLOCKS = {key: StructuralBlock(type=block_type) for key, block_type in _STRUCTURAL_BLOCK_TYPES.items()}
+
 def process_tabs_recursively(tabs: List, level: int = 0, target_tab_id: Optional[str] = None, inline_objects: dict = None) -> List[TabContent]:
     """
-    Recursively process tabs and their child tabs.
+    Process tabs and their child tabs depth-first.
+
+    Walks the tab tree with an explicit stack rather than Python recursion, so deeply
+    nested tab hierarchies cannot hit the interpreter recursion limit.
 
     Args:
         tabs: List of tab objects from Google Docs API
-        level: Current nesting level for indentation
+        level: Nesting level of the top-level tabs (recorded on each TabContent)
         target_tab_id: If specified, only process this specific tab ID
         inline_objects: Dictionary of inline objects (images) from document
 
@@ -167,67 +232,197 @@ def process_tabs_recursively(tabs: List, level: int = 0, target_tab_id: Optional
     """
     processed_tabs: List[TabContent] = []
     inline_objects = inline_objects or {}
-    
-    for i, tab in enumerate(tabs):
-        tab_properties = tab.get('tabProperties', {})
+
+    def _child_items(child_tabs: List, nested_tabs: List, child_level: int, dest: List) -> List[tuple]:
+        items = [('enter', child, j, child_level, dest) for j, child in enumerate(child_tabs)]
+        items.extend(('enter', child, j, child_level, dest) for j, child in enumerate(nested_tabs))
+        return items
+
+    # Work items are ('enter', tab, index, level, dest) or
+    # ('exit', tab_id, title, index, level, content_blocks, child_tab_list, dest, slot)
+    stack: List[tuple] = [('enter', tab, i, level, processed_tabs) for i, tab in enumerate(tabs)]
+    stack.reverse()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    while stack:
+        item = stack.pop()
+
+        if item[0] == 'exit':
+            _, tab_id, tab_title, i, tab_level, content_blocks, child_tab_list, dest, slot = item
+            dest[slot] = TabContent(
+                tabId=tab_id,
+                title=tab_title,
+                level=tab_level,
+                index=i + 1,
+                content=content_blocks,
+                childTabs=child_tab_list
+            )
+            continue
+
+        _, tab, i, tab_level, dest = item
+        tab_properties = tab.get('tabProperties') or _EMPTY_MAPPING
         tab_title = tab_properties.get('title', f'Tab {i+1}')
         tab_id = tab_properties.get('tabId', 'unknown')
+        child_tabs = tab.get('childTabs') or ()
+        # Also check for nested tabs in different structure
+        nested_tabs = tab.get('tabs') or ()
 
         # If target_tab_id is specified, skip tabs that don't match
         if target_tab_id and tab_id != target_tab_id:
-            # Still check child tabs recursively
-            child_tabs = tab.get('childTabs', [])
-            if child_tabs:
-                child_tab_results = process_tabs_recursively(child_tabs, level + 1, target_tab_id, inline_objects)
-                processed_tabs.extend(child_tab_results)
-
-            nested_tabs = tab.get('tabs', [])
-            if nested_tabs:
-                nested_tab_results = process_tabs_recursively(nested_tabs, level + 1, target_tab_id, inline_objects)
-                processed_tabs.extend(nested_tab_results)
+            # Still check child tabs, hoisting any matches into this tab's destination
+            stack.extend(reversed(_child_items(child_tabs, nested_tabs, tab_level + 1, dest)))
             continue
 
-        logger.info(f"[process_tabs_recursively] Processing tab at level {level}: '{tab_title}' (ID: {tab_id})")
-
         # Process document content for this tab
         content_blocks: List[ContentBlock] = []
-        document_tab = tab.get('documentTab', {})
-        if document_tab:
-            tab_body = document_tab.get('body', {})
-            if tab_body:
-                tab_content = tab_body.get('content', [])
-                logger.info(f"[process_tabs_recursively] Tab {i} has {len(tab_content)} content elements")
-
-                if tab_content:
-                    content_blocks = process_structural_elements(tab_content, inline_objects)
+        document_tab = tab.get('documentTab')
+        tab_body = document_tab.get('body') if document_tab else None
+        tab_content = (tab_body.get('content') if tab_body else None) or ()
+        if tab_content:
+            content_blocks = process_structural_elements(tab_content, inline_objects)
+
+        if debug_enabled:
+            logger.debug(
+                f"[process_tabs_recursively] Processed tab at level {tab_level}: '{tab_title}' (ID: {tab_id}), "
+                f"{len(tab_content)} content elements, {len(child_tabs)} child tabs, {len(nested_tabs)} nested tabs"
+            )
 
-        # Process child tabs recursively
+        # Reserve this tab's position; the TabContent is built once its children are done
+        slot = len(dest)
+        dest.append(None)
         child_tab_list: List[TabContent] = []
-        child_tabs = tab.get('childTabs', [])
-        if child_tabs:
-            logger.info(f"[process_tabs_recursively] Tab '{tab_title}' has {len(child_tabs)} child tabs")
-            child_tab_list = process_tabs_recursively(child_tabs, level + 1, target_tab_id, inline_objects)
+        stack.append(('exit', tab_id, tab_title, i, tab_level, content_blocks, child_tab_list, dest, slot))
+        stack.extend(reversed(_child_items(child_tabs, nested_tabs, tab_level + 1, child_tab_list)))
 
-        # Also check for nested tabs in different structure
-        nested_tabs = tab.get('tabs', [])
-        if nested_tabs:
-            logger.info(f"[process_tabs_recursively] Tab '{tab_title}' has {len(nested_tabs)} nested tabs")
-            nested_tab_results = process_tabs_recursively(nested_tabs, level + 1, target_tab_id, inline_objects)
-            child_tab_list.extend(nested_tab_results)
-
-        # Create TabContent object
-        tab_obj = TabContent(
-            tabId=tab_id,
-            title=tab_title,
-            level=level,
-            index=i + 1,
-            content=content_blocks,
-            childTabs=child_tab_list
-        )
+    return processed_tabs
 
-        processed_tabs.append(tab_obj)
+def _discard_task(task: asyncio.Future) -> None:
+    """Cancel a speculative task without waiting for it, swallowing whatever it ends with."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
-    return processed_tabs
+def _download_media(request_obj: HttpRequest, file_size: int) -> bytes:
+    """
+    Download a Drive media request to bytes within a single executor job.
+
+    Files known to fit in one chunk are fetched with a single request; larger or
+    unknown-size files go through MediaIoBaseDownload, looping over chunks here
+    rather than hopping back to the event loop between them.
+    """
+    if 0 < file_size <= _DOWNLOAD_CHUNK_SIZE:
+        return request_obj.execute()
+
+    fh = io.BytesIO()
+    downloader = MediaIoBaseDownload(fh, request_obj, chunksize=_DOWNLOAD_CHUNK_SIZE)
+    done = False
+    while not done:
+        _, done = downloader.next_chunk()
+    return fh.getvalue()
+
+def _handle_paragraph(key: str, paragraph: dict, dest: List, inline_objects: dict, work: List, pending: List) -> None:
+    """Append a ParagraphBlock for a paragraph element, if it has any text or images."""
+    para_elem_list: List[Union[TextElement, ImageElement]] = []
+    # Adjacent text runs only differ by styling, which TextElement doesn't carry,
+    # so collect them and join once per contiguous span
+    text_parts: List[str] = []
+
+    for pe in paragraph.get('elements') or ():
+        # Handle text runs; nearly every paragraph element is one, so index directly
+        try:
+            text_parts.append(pe['textRun']['content'])
+            continue
+        except KeyError:
+            pass
+
+        # Handle inline objects (images)
+        inline_object_element = pe.get('inlineObjectElement')
+        if inline_object_element:
+            inline_object_id = inline_object_element.get('inlineObjectId')
+            if inline_object_id and inline_object_id in inline_objects:
+                if text_parts:
+                    para_elem_list.append(TextElement(type='text', content="".join(text_parts)))
+                    text_parts = []
+
+                inline_obj = inline_objects[inline_object_id]
+                inline_obj_props = inline_obj.get('inlineObjectProperties', {})
+                embedded_obj = inline_obj_props.get('embeddedObject', {})
+
+                # Get image size if available
+                size = embedded_obj.get('size', {})
+                width = size.get('width', {})
+                height = size.get('height', {})
+
+                para_elem_list.append(ImageElement(
+                    type='image',
+                    imageId=inline_object_id,
+                    title=embedded_obj.get('title', 'Untitled Image'),
+                    description=embedded_obj.get('description', ''),
+                    contentUri=embedded_obj.get('imageProperties', {}).get('contentUri', ''),
+                    width=width.get('magnitude') if width else None,
+                    height=height.get('magnitude') if height else None,
+                    widthUnit=width.get('unit') if width else None,
+                    heightUnit=height.get('unit') if height else None
+                ))
+
+    if text_parts:
+        para_elem_list.append(TextElement(type='text', content="".join(text_parts)))
+
+    if para_elem_list:
+        dest.append(ParagraphBlock(
+            type='paragraph',
+            elements=para_elem_list
+        ))
+
+def _handle_table(key: str, table: dict, dest: List, inline_objects: dict, work: List, pending: List) -> None:
+    """Reserve a slot for a table and queue each cell's content on the work stack."""
+    cell_lists: List[List[List[ContentBlock]]] = []
+    for row in table.get('tableRows', []):
+        row_lists: List[List[ContentBlock]] = []
+        for cell in row.get('tableCells', []):
+            cell_blocks: List[ContentBlock] = []
+            row_lists.append(cell_blocks)
+            work.append((cell.get('content', []), cell_blocks))
+        cell_lists.append(row_lists)
+
+    pending.append((dest, len(dest), _assemble_table, key, cell_lists))
+    dest.append(None)
+
+def _handle_header_footer(key: str, section: dict, dest: List, inline_objects: dict, work: List, pending: List) -> None:
+    """Reserve a slot for a header/footer and queue its content on the work stack."""
+    blocks: List[ContentBlock] = []
+    work.append((section.get('content', []), blocks))
+    pending.append((dest, len(dest), _assemble_header_footer, key, blocks))
+    dest.append(None)
+
+def _assemble_table(key: str, cell_lists: List[List[List[ContentBlock]]]) -> Optional[TableBlock]:
+    """Build a TableBlock from filled cell block lists, or None if it has no cells."""
+    rows = [
+        TableRow(cells=[TableCell(content=cell_blocks) for cell_blocks in row_lists])
+        for row_lists in cell_lists
+        if row_lists
+    ]
+    return TableBlock(type='table', rows=rows) if rows else None
+
+def _assemble_header_footer(key: str, blocks: List[ContentBlock]) -> HeaderFooterBlock:
+    """Build a HeaderFooterBlock from its filled content blocks."""
+    return HeaderFooterBlock(
+        type='header' if key == 'headerContent' else 'footer',
+        content=blocks
+    )
+
+def _handle_structural(key: str, value: dict, dest: List, inline_objects: dict, work: List, pending: List) -> None:
+    """Append a StructuralBlock for section breaks, TOCs, page breaks and rules."""
+    dest.append(_STRUCTURAL_BLOCKS[key])
+
+# Docs API structural elements carry exactly one content field alongside their
+# start/end indexes; dispatch on that field
+_ELEMENT_HANDLERS = {
+    'paragraph': _handle_paragraph,
+    'table': _handle_table,
+    'headerContent': _handle_header_footer,
+    'footerContent': _handle_header_footer,
+    **{key: _handle_structural for key in _STRUCTURAL_BLOCK_TYPES},
+}
 
 def process_structural_elements(elements: List, inline_objects: dict = None) -> List[ContentBlock]:
     """
@@ -243,104 +438,31 @@ def process_structural_elements(elements: List, inline_objects: dict = None) ->
     processed_content: List[ContentBlock] = []
     inline_objects = inline_objects or {}
 
-    for element in elements:
-        if 'paragraph' in element:
-            # Handle paragraph elements
-            paragraph = element.get('paragraph', {})
-            para_elements = paragraph.get('elements', [])
-
-            para_elem_list: List[Union[TextElement, ImageElement]] = []
-
-            for pe in para_elements:
-                # Handle text runs
-                text_run = pe.get('textRun', {})
-                if text_run and 'content' in text_run:
-                    para_elem_list.append(TextElement(
-                        type='text',
-                        content=text_run['content']
-                    ))
-
-                # Handle inline objects (images)
-                inline_object_element = pe.get('inlineObjectElement', {})
-                if inline_object_element:
-                    inline_object_id = inline_object_element.get('inlineObjectId')
-                    if inline_object_id and inline_object_id in inline_objects:
-                        inline_obj = inline_objects[inline_object_id]
-                        inline_obj_props = inline_obj.get('inlineObjectProperties', {})
-                        embedded_obj = inline_obj_props.get('embeddedObject', {})
-
-                        # Get image size if available
-                        size = embedded_obj.get('size', {})
-                        width = size.get('width', {})
-                        height = size.get('height', {})
-
-                        para_elem_list.append(ImageElement(
-                            type='image',
-                            imageId=inline_object_id,
-                            title=embedded_obj.get('title', 'Untitled Image'),
-                            description=embedded_obj.get('description', ''),
-                            contentUri=embedded_obj.get('imageProperties', {}).get('contentUri', ''),
-                            width=width.get('magnitude') if width else None,
-                            height=height.get('magnitude') if height else None,
-                            widthUnit=width.get('unit') if width else None,
-                            heightUnit=height.get('unit') if height else None
-                        ))
-
-            if para_elem_list:
-                processed_content.append(ParagraphBlock(
-                    type='paragraph',
-                    elements=para_elem_list
-                ))
-                
-        elif 'table' in element:
-            # Handle table elements
-            table = element.get('table', {})
-            table_rows = table.get('tableRows', [])
-
-            rows: List[TableRow] = []
-
-            for row in table_rows:
-                row_cells = row.get('tableCells', [])
-                cells: List[TableCell] = []
-
-                for cell in row_cells:
-                    cell_content = cell.get('content', [])
-                    cell_blocks = process_structural_elements(cell_content, inline_objects)
-                    cells.append(TableCell(content=cell_blocks))
-
-                if cells:
-                    rows.append(TableRow(cells=cells))
-
-            if rows:
-                processed_content.append(TableBlock(type='table', rows=rows))
-
-        elif 'sectionBreak' in element:
-            processed_content.append(StructuralBlock(type='section_break'))
-
-        elif 'tableOfContents' in element:
-            processed_content.append(StructuralBlock(type='table_of_contents'))
-
-        elif 'pageBreak' in element:
-            processed_content.append(StructuralBlock(type='page_break'))
-
-        elif 'horizontalRule' in element:
-            processed_content.append(StructuralBlock(type='horizontal_rule'))
-
-        elif 'footerContent' in element:
-            footer_content = element.get('footerContent', {}).get('content', [])
-            footer_blocks = process_structural_elements(footer_content, inline_objects)
-            processed_content.append(HeaderFooterBlock(
-                type='footer',
-                content=footer_blocks
-            ))
-
-        elif 'headerContent' in element:
-            header_content = element.get('headerContent', {}).get('content', [])
-            header_blocks = process_structural_elements(header_content, inline_objects)
-            processed_content.append(HeaderFooterBlock(
-                type='header',
-                content=header_blocks
-            ))
+    # Nested content (table cells, headers, footers) is processed from a work stack
+    # of (elements, destination) pairs instead of recursing. Containers reserve a
+    # slot in their parent and are recorded in pending for assembly afterwards.
+    work: List[tuple] = [(elements, processed_content)]
+    pending: List[tuple] = []
+    get_handler = _ELEMENT_HANDLERS.get
+
+    while work:
+        current_elements, dest = work.pop()
+
+        for element in current_elements:
+            for key, value in element.items():
+                handler = get_handler(key)
+                if handler:
+                    handler(key, value, dest, inline_objects, work, pending)
+                    break
+
+    # Nested containers are discovered after the container holding them, so
+    # assembling in reverse order builds inner blocks before their parents use them
+    for dest, slot, assemble, key, data in reversed(pending):
+        block = assemble(key, data)
+        if block is not None:
+            dest[slot] = block
+        else:
+            del dest[slot]
 
     return processed_content
 
@@ -368,13 +490,13 @@ async def search_docs(
     """
     logger.info(f"[search_docs] Email={user_google_email}, Query='{query}'")
 
-    escaped_query = query.replace("'", "\\'")
+    escaped_query = escape_drive_query(query)
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.files().list(
-            q=f"name contains '{escaped_query}' and mimeType='application/vnd.google-apps.document' and trashed=false",
+            q=f"name contains '{escaped_query}'{_DOCS_QUERY_SUFFIX}",
             pageSize=page_size,
-            fields="files(id, name, createdTime, modifiedTime, webViewLink)"
+            fields=_SEARCH_DOCS_FIELDS
         ).execute
     )
     files = response.get('files', [])
@@ -428,30 +550,64 @@ async def get_doc_content(
     """
     logger.info(f"[get_doc_content] Invoked. Document/File ID: '{document_id}' for user '{user_google_email}', tab_id: '{tab_id}'")
 
-    # Step 2: Get file metadata from Drive
-    file_metadata = await asyncio.to_thread(
-        drive_service.files().get(
-            fileId=document_id, fields="id, name, mimeType, webViewLink"
-        ).execute
-    )
+    # Step 2: Get file metadata from Drive, overlapping the Docs fetch with it.
+    # Most IDs passed here are native Docs, so the Docs request is issued
+    # speculatively and its result (or error) is discarded for other file types.
+    def _start_doc_fetch(doc_id: str) -> asyncio.Future:
+        return asyncio.ensure_future(run_api_call(
+            docs_service.documents().get(
+                documentId=doc_id,
+                includeTabsContent=True,
+                fields=_DOC_FIELD_MASK
+            ).execute
+        ))
+
+    async def _get_file_metadata(file_id: str, pending: asyncio.Future) -> Dict[str, Any]:
+        try:
+            return await run_api_call(
+                drive_service.files().get(
+                    fileId=file_id, fields="id, name, mimeType, webViewLink, size, shortcutDetails"
+                ).execute
+            )
+        except BaseException:
+            _discard_task(pending)
+            raise
+
+    doc_task = _start_doc_fetch(document_id)
+    file_metadata = await _get_file_metadata(document_id, doc_task)
     mime_type = file_metadata.get("mimeType", "")
     file_name = file_metadata.get("name", "Unknown File")
+
+    # A shortcut has no content of its own; read the file it points to instead
+    if mime_type == "application/vnd.google-apps.shortcut":
+        _discard_task(doc_task)
+        target_id = file_metadata.get("shortcutDetails", {}).get("targetId")
+        if not target_id:
+            raise ValueError(f'Shortcut "{file_name}" (ID: {document_id}) has no target')
+        logger.info(f"[get_doc_content] '{file_name}' (ID: {document_id}) is a shortcut; following it to target ID '{target_id}'")
+        document_id = target_id
+        doc_task = _start_doc_fetch(document_id)
+        file_metadata = await _get_file_metadata(document_id, doc_task)
+        mime_type = file_metadata.get("mimeType", "")
+        file_name = file_metadata.get("name", "Unknown File")
+
     web_view_link = file_metadata.get("webViewLink", "#")
 
     logger.info(f"[get_doc_content] File '{file_name}' (ID: {document_id}) has mimeType: '{mime_type}'")
 
+    # Fail fast on IDs that can't have content, before waiting on or downloading anything
+    if not mime_type or mime_type == "application/vnd.google-apps.folder":
+        _discard_task(doc_task)
+        if not mime_type:
+            raise ValueError(f'Could not determine mimeType for file "{file_name}" (ID: {document_id})')
+        raise ValueError(f'"{file_name}" (ID: {document_id}) is a folder, not a document')
+
     body_text = "" # Initialize body_text
 
     # Step 3: Process based on mimeType
     if mime_type == "application/vnd.google-apps.document":
         logger.info(f"[get_doc_content] Processing as native Google Doc.")
-        doc_data = await asyncio.to_thread(
-            docs_service.documents().get(
-                documentId=document_id,
-                includeTabsContent=True
-            ).execute
-        )
-        logger.info(f"[get_doc_content] Processing as native Google Doc.")
+        doc_data = await doc_task
 
         # Extract inline objects (images) from the document
         inline_objects = doc_data.get('inlineObjects', {})
@@ -460,50 +616,25 @@ async def get_doc_content(
         # Process tabs if they exist
         tabs = doc_data.get('tabs', [])
         logger.info(f"[get_doc_content] Found {len(tabs)} tabs")
-        
-        # Debug: Print full document structure
-        logger.info(f"[get_doc_content] Document keys: {list(doc_data.keys())}")
-        if tabs:
-            for i, tab in enumerate(tabs):
-                logger.info(f"[get_doc_content] Tab {i} keys: {list(tab.keys())}")
-                logger.info(f"[get_doc_content] Tab {i} properties: {tab.get('tabProperties', {})}")
-                
-                # Check for child tabs in all possible locations
-                child_tabs = tab.get('childTabs', [])
-                nested_tabs = tab.get('tabs', [])
-                document_tab = tab.get('documentTab', {})
-                
-                logger.info(f"[get_doc_content] Tab {i} has {len(child_tabs)} childTabs")
-                logger.info(f"[get_doc_content] Tab {i} has {len(nested_tabs)} nested tabs")
-                logger.info(f"[get_doc_content] Tab {i} documentTab keys: {list(document_tab.keys()) if document_tab else 'None'}")
-                
-                if document_tab:
-                    tab_body = document_tab.get('body', {})
-                    if tab_body:
-                        tab_content = tab_body.get('content', [])
-                        logger.info(f"[get_doc_content] Tab {i} body content elements: {len(tab_content)}")
-                        # Log first few elements to understand structure
-                        for j, element in enumerate(tab_content[:3]):
-                            logger.info(f"[get_doc_content] Tab {i} element {j}: {list(element.keys())}")
-                    else:
-                        logger.info(f"[get_doc_content] Tab {i} has no body")
-        
+
         # Build image metadata dictionary using Pydantic models
         images_metadata: Dict[str, ImageMetadata] = {}
         for img_id, img_obj in inline_objects.items():
             img_props = img_obj.get('inlineObjectProperties', {})
             embedded = img_props.get('embeddedObject', {})
             img_size = embedded.get('size', {})
+            img_width = img_size.get('width', {})
+            img_height = img_size.get('height', {})
 
             images_metadata[img_id] = ImageMetadata(
                 id=img_id,
                 title=embedded.get('title', 'Untitled Image'),
                 description=embedded.get('description', ''),
                 contentUri=embedded.get('imageProperties', {}).get('contentUri', ''),
-                width=img_size.get('width', {}).get('magnitude'),
-                height=img_size.get('height', {}).get('magnitude'),
-                widthUnit=img_size.get('width', {}).get('unit'),
-                heightUnit=img_size.get('height', {}).get('unit')
+                width=img_width.get('magnitude'),
+                height=img_height.get('magnitude'),
+                widthUnit=img_width.get('unit'),
+                heightUnit=img_height.get('unit')
             )
 
         # Build document metadata
@@ -535,7 +666,10 @@ async def get_doc_content(
             if tab_id:
                 logger.warning(f"[get_doc_content] tab_id '{tab_id}' specified but document has no tabs")
                 raise ValueError(f'Specified tab_id "{tab_id}" but document has no tabs')
-            body_elements = doc_data.get('body', {}).get('content', [])
+            try:
+                body_elements = doc_data['body']['content']
+            except KeyError:
+                body_elements = []
             content_list = process_structural_elements(body_elements, inline_objects)
 
         # Build StructuredDocumentContent with Pydantic model
@@ -550,6 +684,7 @@ async def get_doc_content(
         return structured_doc
     else:
         logger.info(f"[get_doc_content] Processing as Drive file (e.g., .docx, other). MimeType: {mime_type}")
+        _discard_task(doc_task)
 
         # tab_id is not supported for non-Google Docs files
         if tab_id:
@@ -569,26 +704,23 @@ async def get_doc_content(
             else drive_service.files().get_media(fileId=document_id)
         )
 
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request_obj)
-        loop = asyncio.get_event_loop()
-        done = False
-        while not done:
-            status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-        file_content_bytes = fh.getvalue()
+        loop = asyncio.get_running_loop()
+        file_size = int(file_metadata.get("size") or 0)
+        file_content_bytes = await loop.run_in_executor(_DOWNLOAD_EXECUTOR, _download_media, request_obj, file_size)
 
-        office_text = extract_office_xml_text(file_content_bytes, mime_type)
-        if office_text:
-            body_text = office_text
-        else:
+        body_text = None
+        if mime_type in _OFFICE_MIME_TYPES:
+            body_text = extract_office_xml_text(file_content_bytes, mime_type)
+        if body_text is None and not mime_type.startswith(_BINARY_MIME_PREFIXES):
             try:
                 body_text = file_content_bytes.decode("utf-8")
             except UnicodeDecodeError:
-                body_text = (
-                    f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
-                    f"{len(file_content_bytes)} bytes]"
-                )
+                pass
+        if body_text is None:
+            body_text = (
+                f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
+                f"{len(file_content_bytes)} bytes]"
+            )
 
     # Return structured model for non-Google Docs files using Pydantic models
     doc_metadata = DocumentMetadata(
@@ -636,12 +768,11 @@ async def list_docs_in_folder(
     """
     logger.info(f"[list_docs_in_folder] Invoked. Email: '{user_google_email}', Folder ID: '{folder_id}'")
 
-    rsp = await asyncio.to_thread(
+    rsp = await run_api_call(
         service.files().list(
-            
-            q=f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false",
+            q=f"'{folder_id}' in parents{_DOCS_QUERY_SUFFIX}",
             pageSize=page_size,
-            fields="files(id, name, modifiedTime, webViewLink)"
+            fields=_LIST_DOCS_FIELDS
         ).execute
     )
     items = rsp.get('files', [])
@@ -662,6 +793,90 @@ async def list_docs_in_folder(
         documents=documents
     )
 
+@server.tool
+@require_google_service("drive", "drive_read")
+@handle_http_errors("list_docs_in_folders")
+async def list_docs_in_folders(
+    service,
+    ctx: Context,
+    folder_ids: List[str],
+    user_google_email: Optional[str] = None,
+    page_size: int = 100
+) -> ListDocsInFoldersResponse:
+    """
+    <description>Lists Google Docs in several Drive folders at once using a single Drive batch request per 100 folders. Returns each folder's document names, IDs, modification times, and web view links.</description>
+
+    <use_case>Surveying documents across many project folders, bulk processing documents from multiple directories, or replacing repeated list_docs_in_folder calls with one round-trip.</use_case>
+
+    <limitation>Limited to Google Docs format only. Shows only immediate folder contents, not recursive subfolder documents. Returns up to page_size documents per folder with no pagination.</limitation>
+
+    <failure_cases>Individual folders that are invalid or inaccessible are reported in errors rather than failing the whole call. Fails if no folder IDs are provided or if Google Drive API quotas are exceeded.</failure_cases>
+
+    Args:
+        folder_ids: List of Drive folder IDs to list
+        user_google_email: Optional user email for context
+        page_size: Maximum documents to return per folder
+
+    Returns:
+        ListDocsInFoldersResponse: Structured per-folder document listings and any errors.
+    """
+    logger.info(f"[list_docs_in_folders] Invoked. Email: '{user_google_email}', Folder count: {len(folder_ids)}")
+
+    if not folder_ids:
+        raise Exception("No folder IDs provided")
+
+    folders: List[ListDocsResponse] = []
+    errors: List[Dict[str, str]] = []
+
+    # Drive accepts at most 100 calls per batch request
+    for chunk_start in range(0, len(folder_ids), 100):
+        chunk_ids = folder_ids[chunk_start:chunk_start + 100]
+        results: Dict[str, Dict] = {}
+
+        def _batch_callback(request_id, response, exception):
+            """Callback for batch requests"""
+            results[request_id] = {"data": response, "error": exception}
+
+        batch = service.new_batch_http_request(callback=_batch_callback)
+        for i, folder_id in enumerate(chunk_ids):
+            batch.add(
+                service.files().list(
+                    q=f"'{folder_id}' in parents{_DOCS_QUERY_SUFFIX}",
+                    pageSize=page_size,
+                    fields=_LIST_DOCS_FIELDS
+                ),
+                request_id=str(i)
+            )
+
+        await run_api_call(batch.execute)
+
+        for i, folder_id in enumerate(chunk_ids):
+            entry = results.get(str(i), {"data": None, "error": "No result"})
+            if entry["error"]:
+                errors.append({"folder_id": folder_id, "error": str(entry["error"])})
+                continue
+
+            items = (entry["data"] or {}).get('files', [])
+            folders.append(ListDocsResponse(
+                folder_id=folder_id,
+                total_found=len(items),
+                documents=[
+                    DocReference(
+                        id=f['id'],
+                        name=f['name'],
+                        modified_time=f.get('modifiedTime'),
+                        web_view_link=f.get('webViewLink')
+                    )
+                    for f in items
+                ]
+            ))
+
+    return ListDocsInFoldersResponse(
+        total_folders=len(folder_ids),
+        folders=folders,
+        errors=errors
+    )
+
 
 def markdown_to_html(markdown_text: str) -> str:
     """
@@ -871,7 +1086,7 @@ async def fix_image_sizes_in_doc(
     """
     try:
         # Get document to check for images
-        doc = await asyncio.to_thread(
+        doc = await run_api_call(
             docs_service.documents().get(
                 documentId=document_id,
                 includeTabsContent=False
@@ -933,7 +1148,7 @@ async def fix_image_sizes_in_doc(
         # Execute batch update if there are changes
         if requests:
             logger.info(f"[fix_image_sizes_in_doc] Applying {len(requests)} resize operations")
-            await asyncio.to_thread(
+            await run_api_call(
                 docs_service.documents().batchUpdate(
                     documentId=document_id,
                     body={'requests': requests}
@@ -1041,7 +1256,7 @@ async def create_doc_from_html(
         response = urllib.request.urlopen(req)
         return json.loads(response.read().decode('utf-8'))
 
-    result = await asyncio.to_thread(_execute_upload)
+    result = await run_api_call(_execute_upload)
 
     logger.info(f"[create_doc_from_html] Created document: {result.get('id')}")
 
@@ -1087,7 +1302,7 @@ async def create_doc(
         # Create empty document using Docs API for backward compatibility
         logger.info(f"[create_doc] No content provided, creating empty document")
 
-        doc = await asyncio.to_thread(docs_service.documents().create(body={'title': title}).execute)
+        doc = await run_api_call(docs_service.documents().create(body={'title': title}).execute)
         doc_id = doc.get('documentId')
         link = f"https://docs.google.com/document/d/{doc_id}/edit"
     else:
@@ -1108,9 +1323,12 @@ async def create_doc(
         doc_id = result.get('id')
         link = result.get('webViewLink', f"https://docs.google.com/document/d/{doc_id}/edit")
 
-        # Post-processing: Fix oversized images using Docs API
-        logger.info(f"[create_doc] Checking and fixing image sizes...")
-        await fix_image_sizes_in_doc(docs_service, doc_id, target_width=350, max_threshold=450)
+        # Post-processing: Fix oversized images using Docs API. This costs an extra
+        # documents.get round-trip, so only do it when the upload contained images.
+        # Markdown passes raw HTML through as written, so match <IMG> too
+        if '<img' in html_content.lower():
+            logger.info(f"[create_doc] Checking and fixing image sizes...")
+            await fix_image_sizes_in_doc(docs_service, doc_id, target_width=350, max_threshold=450)
 
     msg = f"Created Google Doc '{title}' (ID: {doc_id}) for {user_google_email}. Link: {link}"
     logger.info(f"[create_doc] {msg}")
@@ -1578,7 +1796,7 @@ async def append_html_to_doc(
         )
         return request.execute().decode('utf-8')
 
-    existing_html = await asyncio.to_thread(_export_html)
+    existing_html = await run_api_call(_export_html)
 
     # Step 2: Parse and append new content
     # Find the closing body tag and insert before it
@@ -1649,7 +1867,7 @@ async def append_html_to_doc(
         response = urllib.request.urlopen(req)
         return json.loads(response.read().decode('utf-8'))
 
-    result = await asyncio.to_thread(_update_doc)
+    result = await run_api_call(_update_doc)
 
     logger.info(f"[append_html_to_doc] Document updated successfully")
 
@@ -1740,6 +1958,3 @@ read_doc_comments = _comment_tools['read_comments']
 create_doc_comment = _comment_tools['create_comment']
 reply_to_comment = _comment_tools['reply_to_comment']
 resolve_comment = _comment_tools['resolve_comment']
-
-if __name__ == '__main__':
-    asyncio.run(get_doc_content(drive_service="drive", docs_service="docs", document_id="18-52JXU073R9wQ6ip-MrKMjHVq2QgR1VIEFXgMGyuI8"))
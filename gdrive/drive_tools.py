@@ -17,7 +17,7 @@ from fastmcp import Context
 from pydantic import BaseModel
 
 from auth.service_decorator import require_google_service
-from core.utils import extract_office_xml_text, handle_http_errors
+from core.utils import escape_drive_query, extract_office_xml_text, handle_http_errors
 from core.server import server
 
 logger = logging.getLogger(__name__)
@@ -139,7 +139,7 @@ async def search_drive_files(
         logger.info(f"[search_drive_files] Using structured query as-is: '{final_query}'")
     else:
         # For free text queries, wrap in fullText contains
-        escaped_query = query.replace("'", "\\'")
+        escaped_query = escape_drive_query(query)
         final_query = f"fullText contains '{escaped_query}'"
         logger.info(f"[search_drive_files] Reformatting free text query '{query}' to '{final_query}'")
 
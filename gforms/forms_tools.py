@@ -6,17 +6,113 @@ This module provides MCP tools for interacting with Google Forms API.
 
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+import re
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 
-from mcp import types
 from fastmcp import Context
+from googleapiclient.errors import HttpError
 
 from auth.service_decorator import require_google_service
 from core.server import server
-from core.utils import handle_http_errors
+from core.utils import current_credential_identity, get_user_rate_limiter, handle_http_errors, rate_limit_retry_delay, run_api_call
 
 logger = logging.getLogger(__name__)
 
+# Forms API per-user quota (requests/minute); each account is paced on its own bucket
+_FORMS_QUOTA = 300
+_MAX_RATE_LIMIT_RETRIES = 3
+# Cap in-flight Forms calls below the shared API executor's 16 workers so a burst
+# of Forms requests queues here instead of occupying every thread
+_FORMS_CONCURRENCY = asyncio.Semaphore(8)
+
+# Form URLs, used when the API response doesn't carry a responderUri
+_EDIT_URL_FMT = "https://docs.google.com/forms/d/%s/edit"
+_RESPONDER_URL_FMT = "https://docs.google.com/forms/d/%s/viewform"
+
+# Form and response IDs are URL-safe base64-style tokens; anything else can only 404
+_FORMS_ID_RE = re.compile(r"^[A-Za-z0-9_-]{20,128}$")
+
+# Rendered get_form output keyed by (user, form ID), tagged with the form's revisionId.
+# A cached entry is only reused after a revisionId-only fetch confirms it is current.
+_FORM_CACHE: "OrderedDict[Tuple[Optional[str], str], Tuple[str, str]]" = OrderedDict()
+_FORM_CACHE_MAX_ENTRIES = 256
+
+
+def _validate_forms_id(value: str, name: str) -> None:
+    """Reject malformed form/response IDs before spending a request on them."""
+    if not _FORMS_ID_RE.match(value):
+        raise ValueError(f'Invalid {name} "{value}"')
+
+
+def _format_form(form: Dict[str, Any], form_id: str, user_google_email: Optional[str]) -> str:
+    """Render a Forms API form resource as the get_form details text."""
+    form_info = form.get("info", {})
+    title = form_info.get("title", "No Title")
+    description = form_info.get("description", "No Description")
+    document_title = form_info.get("documentTitle", title)
+
+    edit_url = _EDIT_URL_FMT % form_id
+    responder_url = form.get("responderUri") or _RESPONDER_URL_FMT % form_id
+
+    items = form.get("items") or ()
+    questions_text = "\n".join(
+        f"  {i}. {item.get('title', f'Question {i}')}"
+        f"{' (Required)' if item.get('questionItem', {}).get('question', {}).get('required', False) else ''}"
+        for i, item in enumerate(items, 1)
+    ) or "  No questions found"
+
+    return f"""Form Details for {user_google_email}:
+- Title: "{title}"
+- Description: "{description}"
+- Document Title: "{document_title}"
+- Form ID: {form_id}
+- Edit URL: {edit_url}
+- Responder URL: {responder_url}
+- Questions ({len(items)} total):
+{questions_text}"""
+
+
+def _cache_form(cache_key: Tuple[Optional[str], str], form: Dict[str, Any], rendered: str) -> None:
+    """Remember rendered get_form output against the form's revisionId."""
+    revision_id = form.get("revisionId")
+    if not revision_id:
+        return
+    _FORM_CACHE[cache_key] = (revision_id, rendered)
+    _FORM_CACHE.move_to_end(cache_key)
+    if len(_FORM_CACHE) > _FORM_CACHE_MAX_ENTRIES:
+        _FORM_CACHE.popitem(last=False)
+
+
+def _invalidate_form_cache(form_id: str) -> None:
+    """Drop cached get_form output for a form after modifying it."""
+    for key in [key for key in _FORM_CACHE if key[1] == form_id]:
+        del _FORM_CACHE[key]
+
+
+def _forms_limiter():
+    """Return the Forms quota bucket for the account the current tool call runs as."""
+    return get_user_rate_limiter("forms", current_credential_identity.get(), _FORMS_QUOTA, 60)
+
+
+async def _execute_forms_request(request):
+    """
+    Execute a Forms API request on the shared API executor, paced by the module rate limiter.
+
+    Rate-limited (429) responses are retried after the delay the server asks for.
+    """
+    for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+        await _forms_limiter().acquire()
+        try:
+            async with _FORMS_CONCURRENCY:
+                return await run_api_call(request.execute)
+        except HttpError as error:
+            if error.resp.status != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                raise
+            delay = rate_limit_retry_delay(error, attempt)
+            logger.warning("[forms] Rate limited by the Forms API, retrying in %.1fs (attempt %d/%d)", delay, attempt + 1, _MAX_RATE_LIMIT_RETRIES)
+            await asyncio.sleep(delay)
+
 
 @server.tool
 @require_google_service("forms", "forms")
@@ -47,7 +143,7 @@ async def create_form(
     Returns:
         str: Confirmation message with form ID and edit URL.
     """
-    logger.info(f"[create_form] Invoked. Email: '{user_google_email}', Title: {title}")
+    logger.info("[create_form] Invoked. Email: '%s', Title: %s", user_google_email, title)
 
     form_body: Dict[str, Any] = {
         "info": {
@@ -61,16 +157,16 @@ async def create_form(
     if document_title:
         form_body["info"]["document_title"] = document_title
 
-    created_form = await asyncio.to_thread(
-        service.forms().create(body=form_body).execute
+    created_form = await _execute_forms_request(
+        service.forms().create(body=form_body)
     )
 
     form_id = created_form.get("formId")
-    edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
-    responder_url = created_form.get("responderUri", f"https://docs.google.com/forms/d/{form_id}/viewform")
+    edit_url = _EDIT_URL_FMT % form_id
+    responder_url = created_form.get("responderUri") or _RESPONDER_URL_FMT % form_id
 
     confirmation_message = f"Successfully created form '{created_form.get('info', {}).get('title', title)}' for {user_google_email}. Form ID: {form_id}. Edit URL: {edit_url}. Responder URL: {responder_url}"
-    logger.info(f"Form created successfully for {user_google_email}. ID: {form_id}")
+    logger.info("Form created successfully for %s. ID: %s", user_google_email, form_id)
     return confirmation_message
 
 
@@ -99,42 +195,100 @@ async def get_form(
     Returns:
         str: Form details including title, description, questions, and URLs.
     """
-    logger.info(f"[get_form] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
+    logger.info("[get_form] Invoked. Email: '%s', Form ID: %s", user_google_email, form_id)
+    _validate_forms_id(form_id, "form_id")
+
+    cache_key = (user_google_email, form_id)
+    cached = _FORM_CACHE.get(cache_key)
+    if cached:
+        current = await _execute_forms_request(
+            service.forms().get(formId=form_id, fields="revisionId")
+        )
+        if current.get("revisionId") == cached[0]:
+            _FORM_CACHE.move_to_end(cache_key)
+            logger.info("[get_form] Form %s unchanged since last fetch, returning cached details", form_id)
+            return cached[1]
 
-    form = await asyncio.to_thread(
-        service.forms().get(formId=form_id).execute
+    form = await _execute_forms_request(
+        service.forms().get(formId=form_id)
     )
 
-    form_info = form.get("info", {})
-    title = form_info.get("title", "No Title")
-    description = form_info.get("description", "No Description")
-    document_title = form_info.get("documentTitle", title)
+    result = _format_form(form, form_id, user_google_email)
+    _cache_form(cache_key, form, result)
 
-    edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
-    responder_url = form.get("responderUri", f"https://docs.google.com/forms/d/{form_id}/viewform")
+    logger.info("Successfully retrieved form for %s. ID: %s", user_google_email, form_id)
+    return result
 
-    items = form.get("items", [])
-    questions_summary = []
-    for i, item in enumerate(items, 1):
-        item_title = item.get("title", f"Question {i}")
-        item_type = item.get("questionItem", {}).get("question", {}).get("required", False)
-        required_text = " (Required)" if item_type else ""
-        questions_summary.append(f"  {i}. {item_title}{required_text}")
 
-    questions_text = "\n".join(questions_summary) if questions_summary else "  No questions found"
+@server.tool
+@require_google_service("forms", "forms")
+@handle_http_errors("get_forms_batch")
+async def get_forms_batch(
+    service,
+    ctx: Context,
+    form_ids: List[str],
+    user_google_email: Optional[str] = None
+):
+    """
+    <description>Retrieves the structure of several Google Forms in one batched API request per 100 forms. Returns the same details as get_form for each form, including title, description, questions, and URLs.</description>
+    
+    <use_case>Inspecting a set of related forms together, auditing many survey configurations at once, or replacing repeated get_form calls with a single round-trip.</use_case>
+    
+    <limitation>Does not return response data - only form structure. Each form in the batch still counts against Forms API quota individually.</limitation>
+    
+    <failure_cases>Forms that are invalid or inaccessible are reported inline rather than failing the whole call. Fails if no form IDs are provided or if Google Forms API quotas are exceeded.</failure_cases>
 
-    result = f"""Form Details for {user_google_email}:
-- Title: "{title}"
-- Description: "{description}"
-- Document Title: "{document_title}"
-- Form ID: {form_id}
-- Edit URL: {edit_url}
-- Responder URL: {responder_url}
-- Questions ({len(items)} total):
-{questions_text}"""
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
+        form_ids (List[str]): The IDs of the forms to retrieve.
 
-    logger.info(f"Successfully retrieved form for {user_google_email}. ID: {form_id}")
-    return result
+    Returns:
+        str: Form details for each requested form, separated by blank lines.
+    """
+    logger.info("[get_forms_batch] Invoked. Email: '%s', Form count: %d", user_google_email, len(form_ids))
+
+    if not form_ids:
+        raise Exception("No form IDs provided")
+
+    output_parts = []
+
+    # Google batch endpoints accept at most 100 calls per request
+    for chunk_start in range(0, len(form_ids), 100):
+        chunk_ids = form_ids[chunk_start:chunk_start + 100]
+        results: Dict[str, Dict] = {}
+
+        def _batch_callback(request_id, response, exception):
+            """Callback for batch requests"""
+            results[request_id] = {"data": response, "error": exception}
+
+        batch = service.new_batch_http_request(callback=_batch_callback)
+        batched = 0
+        for i, form_id in enumerate(chunk_ids):
+            if not _FORMS_ID_RE.match(form_id):
+                results[str(i)] = {"data": None, "error": "Invalid form ID"}
+                continue
+            batch.add(service.forms().get(formId=form_id), request_id=str(i))
+            batched += 1
+
+        # Every call in the batch counts against quota separately
+        for _ in range(batched):
+            await _forms_limiter().acquire()
+        if batched:
+            async with _FORMS_CONCURRENCY:
+                await run_api_call(batch.execute)
+
+        for i, form_id in enumerate(chunk_ids):
+            entry = results.get(str(i), {"data": None, "error": "No result"})
+            if entry["error"]:
+                output_parts.append(f"Form {form_id}: Error - {entry['error']}")
+                continue
+
+            rendered = _format_form(entry["data"] or {}, form_id, user_google_email)
+            _cache_form((user_google_email, form_id), entry["data"] or {}, rendered)
+            output_parts.append(rendered)
+
+    logger.info("Successfully retrieved %d forms for %s", len(form_ids), user_google_email)
+    return "\n\n".join(output_parts)
 
 
 @server.tool
@@ -166,19 +320,21 @@ async def set_publish_settings(
     Returns:
         str: Confirmation message of the successful publish settings update.
     """
-    logger.info(f"[set_publish_settings] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
+    logger.info("[set_publish_settings] Invoked. Email: '%s', Form ID: %s", user_google_email, form_id)
+    _validate_forms_id(form_id, "form_id")
 
     settings_body = {
         "publishAsTemplate": publish_as_template,
         "requireAuthentication": require_authentication
     }
 
-    await asyncio.to_thread(
-        service.forms().setPublishSettings(formId=form_id, body=settings_body).execute
+    await _execute_forms_request(
+        service.forms().setPublishSettings(formId=form_id, body=settings_body)
     )
+    _invalidate_form_cache(form_id)
 
     confirmation_message = f"Successfully updated publish settings for form {form_id} for {user_google_email}. Publish as template: {publish_as_template}, Require authentication: {require_authentication}"
-    logger.info(f"Publish settings updated successfully for {user_google_email}. Form ID: {form_id}")
+    logger.info("Publish settings updated successfully for %s. Form ID: %s", user_google_email, form_id)
     return confirmation_message
 
 
@@ -209,10 +365,12 @@ async def get_form_response(
     Returns:
         str: Response details including answers and metadata.
     """
-    logger.info(f"[get_form_response] Invoked. Email: '{user_google_email}', Form ID: {form_id}, Response ID: {response_id}")
+    logger.info("[get_form_response] Invoked. Email: '%s', Form ID: %s, Response ID: %s", user_google_email, form_id, response_id)
+    _validate_forms_id(form_id, "form_id")
+    _validate_forms_id(response_id, "response_id")
 
-    response = await asyncio.to_thread(
-        service.forms().responses().get(formId=form_id, responseId=response_id).execute
+    response = await _execute_forms_request(
+        service.forms().responses().get(formId=form_id, responseId=response_id)
     )
 
     response_id = response.get("responseId", "Unknown")
@@ -222,9 +380,12 @@ async def get_form_response(
     answers = response.get("answers", {})
     answer_details = []
     for question_id, answer_data in answers.items():
-        question_response = answer_data.get("textAnswers", {}).get("answers", [])
+        try:
+            question_response = answer_data["textAnswers"]["answers"]
+        except KeyError:
+            question_response = None
         if question_response:
-            answer_text = ", ".join([ans.get("value", "") for ans in question_response])
+            answer_text = ", ".join(ans.get("value", "") for ans in question_response)
             answer_details.append(f"  Question ID {question_id}: {answer_text}")
         else:
             answer_details.append(f"  Question ID {question_id}: No answer provided")
@@ -239,7 +400,7 @@ async def get_form_response(
 - Answers:
 {answers_text}"""
 
-    logger.info(f"Successfully retrieved response for {user_google_email}. Response ID: {response_id}")
+    logger.info("Successfully retrieved response for %s. Response ID: %s", user_google_email, response_id)
     return result
 
 
@@ -252,14 +413,15 @@ async def list_form_responses(
     form_id: str,
     user_google_email: Optional[str] = None,
     page_size: int = 10,
-    page_token: Optional[str] = None
+    page_token: Optional[str] = None,
+    max_pages: int = 1
 ):
     """
     <description>Lists all form responses with summary metadata including submission timestamps and response counts. Provides pagination for forms with many responses (>10-100 responses).</description>
     
     <use_case>Getting overview of form response volume, identifying recent submissions for follow-up, or preparing for bulk response analysis with response IDs.</use_case>
     
-    <limitation>Shows only response metadata, not actual answers - use get_form_response for detailed content. Limited to 100 responses per page requiring pagination for larger datasets.</limitation>
+    <limitation>Shows only response metadata, not actual answers - use get_form_response for detailed content. Limited to 100 responses per page; set max_pages to follow several pages in one call.</limitation>
     
     <failure_cases>Fails on forms without response collection enabled, forms the user cannot access, or when API rate limits are exceeded with high-volume polling.</failure_cases>
 
@@ -268,11 +430,13 @@ async def list_form_responses(
         form_id (str): The ID of the form.
         page_size (int): Maximum number of responses to return. Defaults to 10.
         page_token (Optional[str]): Token for retrieving next page of results.
+        max_pages (int): Maximum number of pages to fetch in this call, following page tokens. Defaults to 1.
 
     Returns:
         str: List of responses with basic details and pagination info.
     """
-    logger.info(f"[list_form_responses] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
+    logger.info("[list_form_responses] Invoked. Email: '%s', Form ID: %s", user_google_email, form_id)
+    _validate_forms_id(form_id, "form_id")
 
     params = {
         "formId": form_id,
@@ -281,26 +445,29 @@ async def list_form_responses(
     if page_token:
         params["pageToken"] = page_token
 
-    responses_result = await asyncio.to_thread(
-        service.forms().responses().list(**params).execute
-    )
-
-    responses = responses_result.get("responses", [])
-    next_page_token = responses_result.get("nextPageToken")
+    # Each page's token only arrives with the previous page, so pages are
+    # fetched in sequence, but within one tool call instead of one call per page
+    responses_resource = service.forms().responses()
+    responses = []
+    next_page_token = None
+    for _ in range(max(1, max_pages)):
+        responses_result = await _execute_forms_request(
+            responses_resource.list(**params)
+        )
+        responses.extend(responses_result.get("responses", []))
+        next_page_token = responses_result.get("nextPageToken")
+        if not next_page_token:
+            break
+        params["pageToken"] = next_page_token
 
     if not responses:
         return f"No responses found for form {form_id} for {user_google_email}."
 
-    response_details = []
-    for i, response in enumerate(responses, 1):
-        response_id = response.get("responseId", "Unknown")
-        create_time = response.get("createTime", "Unknown")
-        last_submitted_time = response.get("lastSubmittedTime", "Unknown")
-
-        answers_count = len(response.get("answers", {}))
-        response_details.append(
-            f"  {i}. Response ID: {response_id} | Created: {create_time} | Last Submitted: {last_submitted_time} | Answers: {answers_count}"
-        )
+    response_details = "\n".join(
+        f"  {i}. Response ID: {response.get('responseId', 'Unknown')} | Created: {response.get('createTime', 'Unknown')} | "
+        f"Last Submitted: {response.get('lastSubmittedTime', 'Unknown')} | Answers: {len(response.get('answers', {}))}"
+        for i, response in enumerate(responses, 1)
+    )
 
     pagination_info = f"\nNext page token: {next_page_token}" if next_page_token else "\nNo more pages."
 
@@ -308,7 +475,7 @@ async def list_form_responses(
 - Form ID: {form_id}
 - Total responses returned: {len(responses)}
 - Responses:
-{chr(10).join(response_details)}{pagination_info}"""
+{response_details}{pagination_info}"""
 
-    logger.info(f"Successfully retrieved {len(responses)} responses for {user_google_email}. Form ID: {form_id}")
+    logger.info("Successfully retrieved %d responses for %s. Form ID: %s", len(responses), user_google_email, form_id)
     return result
\ No newline at end of file
@@ -7,17 +7,19 @@ This module provides MCP tools for interacting with the Gmail API.
 import logging
 import asyncio
 import base64
-from typing import Optional, List, Dict, Literal
-from pydantic import BaseModel, Field
+from collections import OrderedDict, deque
+from typing import Optional, Iterable, List, Dict, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
-from email.mime.text import MIMEText
+from email import policy
+from email.message import EmailMessage
 
 from mcp import types
 from fastmcp import Context
 from fastapi import Body
 
 from auth.service_decorator import require_google_service
-from core.utils import handle_http_errors
+from core.utils import current_credential_identity, handle_http_errors, rate_limited, run_api_call
 from core.server import (
     GMAIL_READONLY_SCOPE,
     GMAIL_SEND_SCOPE,
@@ -29,6 +31,54 @@ from core.server import (
 
 logger = logging.getLogger(__name__)
 
+# Messages are built for transport as-is: CRLF line endings, and quoted-printable
+# or base64 rather than raw 8-bit for non-ASCII bodies
+_MIME_POLICY = policy.SMTP.clone(cte_type="7bit")
+
+# Header sets read by the message and thread tools
+_HEADERS_SUBJECT_FROM = frozenset(("Subject", "From"))
+_HEADERS_THREAD = frozenset(("Subject", "From", "Date"))
+
+# Message content is immutable once sent, so full-format results are kept in a
+# small LRU keyed by (credential identity, message ID). The identity comes from the
+# credentials the call resolved, not a caller-supplied email, so one account's
+# messages are never served to another.
+_MESSAGE_CACHE: "OrderedDict[Tuple[str, str], GmailMessageContent]" = OrderedDict()
+_MESSAGE_CACHE_MAX_ENTRIES = 4096
+# Bound on the text held by the cache (characters of subject, sender and body),
+# so a run of large messages can't grow memory without limit
+_MESSAGE_CACHE_MAX_CHARS = 32 * 1024 * 1024
+_message_cache_chars = 0
+
+# Cap on concurrent single-message fetches when a batch request falls back to
+# per-message calls, leaving room on the shared API executor for other tools
+_FALLBACK_FETCH_CONCURRENCY = asyncio.Semaphore(8)
+
+# Web URL prefix for the primary account (see _generate_gmail_web_url)
+_GMAIL_URL_PREFIX = "https://mail.google.com/mail/u/0/#all/"
+
+# Maximum number of 100-message batch requests in flight per batch tool call
+_BATCH_CHUNK_CONCURRENCY = 4
+
+# messages.batchModify accepts at most this many IDs per call
+_BATCH_MODIFY_MAX_IDS = 1000
+
+# Concurrent modify_gmail_message_labels calls applying the same change are
+# coalesced. batchModify costs 50 quota units against 5 for messages.modify, so it
+# is only used once a group reaches the break-even size.
+_BATCH_MODIFY_MIN_IDS = 10
+
+# Gmail API per-user quota (units per second); tools below charge the documented
+# unit cost of the calls they make so bursts queue instead of drawing 429s
+_GMAIL_QUOTA_UNITS = 250
+
+# Bound once; called for every text part decoded in _extract_message_body.
+# pybase64 (SIMD-accelerated) is used when installed.
+try:
+    from pybase64 import urlsafe_b64decode as _b64decode
+except ImportError:
+    _b64decode = base64.urlsafe_b64decode
+
 
 # Response Models
 class GmailMessageRef(BaseModel):
@@ -48,6 +98,9 @@ class SearchGmailMessagesResponse(BaseModel):
 
 class GmailMessageContent(BaseModel):
     """Complete Gmail message content."""
+    # Instances are shared through the message cache, so they must not be mutated
+    model_config = ConfigDict(frozen=True)
+
     message_id: str = Field(..., description="Unique Gmail message ID")
     subject: str = Field(..., description="Email subject")
     sender: str = Field(..., description="Email sender (From field)")
@@ -126,6 +179,15 @@ class ModifyGmailMessageLabelsResponse(BaseModel):
     message: str = Field(..., description="Human-readable confirmation message")
 
 
+class BatchModifyGmailMessagesResponse(BaseModel):
+    """Response for modifying labels on many messages at once."""
+    success: bool = Field(..., description="Whether the operation was successful")
+    message_count: int = Field(..., description="Number of messages modified")
+    added_labels: List[str] = Field(default_factory=list, description="Label IDs that were added")
+    removed_labels: List[str] = Field(default_factory=list, description="Label IDs that were removed")
+    message: str = Field(..., description="Human-readable confirmation message")
+
+
 def _extract_message_body(payload):
     """
     Helper function to extract plain text body from a Gmail message payload.
@@ -136,47 +198,232 @@ def _extract_message_body(payload):
     Returns:
         str: The plain text body content, or empty string if not found
     """
-    body_data = ""
+    # Single-part non-text payloads (e.g. HTML-only newsletters) have no plain
+    # text anywhere, so skip the walk entirely
+    payload_type = payload.get("mimeType", "")
+    if payload_type and not payload_type.startswith(("text/plain", "multipart/")):
+        return ""
+
     parts = [payload] if "parts" not in payload else payload.get("parts", [])
 
-    part_queue = list(parts)  # Use a queue for BFS traversal of parts
+    part_queue = deque(parts)  # Use a queue for BFS traversal of parts
     while part_queue:
-        part = part_queue.pop(0)
-        if part.get("mimeType") == "text/plain" and part.get("body", {}).get("data"):
-            data = base64.urlsafe_b64decode(part["body"]["data"])
-            body_data = data.decode("utf-8", errors="ignore")
-            break  # Found plain text body
-        elif part.get("mimeType", "").startswith("multipart/") and "parts" in part:
-            part_queue.extend(part.get("parts", []))  # Add sub-parts to the queue
+        part = part_queue.popleft()
+        mime_type = part.get("mimeType", "")
+        if mime_type == "text/plain":
+            data = part.get("body", {}).get("data")
+            if data:
+                # Found plain text body
+                return _b64decode(data).decode("utf-8", "ignore")
+        elif mime_type.startswith("multipart/") and "parts" in part:
+            sub_parts = part["parts"]
+            if mime_type == "multipart/alternative":
+                # Alternatives are renderings of the same body; take the plain
+                # text one directly rather than queueing its HTML siblings
+                for sub_part in sub_parts:
+                    if sub_part.get("mimeType") == "text/plain":
+                        data = sub_part.get("body", {}).get("data")
+                        if data:
+                            return _b64decode(data).decode("utf-8", "ignore")
+            part_queue.extend(sub_parts)  # Add sub-parts to the queue
 
     # If no plain text found, check the main payload body if it exists
-    if (
-        not body_data
-        and payload.get("mimeType") == "text/plain"
-        and payload.get("body", {}).get("data")
-    ):
-        data = base64.urlsafe_b64decode(payload["body"]["data"])
-        body_data = data.decode("utf-8", errors="ignore")
+    if payload.get("mimeType") == "text/plain":
+        data = payload.get("body", {}).get("data")
+        if data:
+            return _b64decode(data).decode("utf-8", "ignore")
 
-    return body_data
+    return ""
 
 
-def _extract_headers(payload: dict, header_names: List[str]) -> Dict[str, str]:
+def _extract_headers(payload: dict, header_names: Iterable[str]) -> Dict[str, str]:
     """
     Extract specified headers from a Gmail message payload.
 
     Args:
         payload: The message payload from Gmail API
-        header_names: List of header names to extract
+        header_names: Header names to extract; pass a frozenset to skip the conversion
 
     Returns:
         Dict mapping header names to their values
     """
-    headers = {}
-    for header in payload.get("headers", []):
-        if header["name"] in header_names:
-            headers[header["name"]] = header["value"]
-    return headers
+    wanted = header_names if isinstance(header_names, frozenset) else frozenset(header_names)
+    return {h["name"]: h["value"] for h in payload.get("headers", ()) if h["name"] in wanted}
+
+
+def _build_raw_message(body: str, subject: str, to: Optional[str] = None) -> str:
+    """
+    Assemble a plain text RFC 822 message and encode it for the Gmail API raw field.
+
+    Args:
+        body: Plain text message body
+        subject: Message subject
+        to: Optional recipient address
+
+    Returns:
+        str: The URL-safe base64 encoded message
+    """
+    for name, value in (("to", to), ("subject", subject)):
+        # A line break would let the value start a new header (header injection)
+        if value and ("\r" in value or "\n" in value):
+            raise ValueError(f"Line breaks are not allowed in the {name} header")
+
+    # The email package encodes non-ASCII headers and picks a 7-bit safe body
+    # encoding; the SMTP policy gives CRLF line endings
+    message = EmailMessage(policy=_MIME_POLICY)
+    if to:
+        message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    return base64.urlsafe_b64encode(message.as_bytes()).decode("ascii")
+
+
+def _message_chars(content: GmailMessageContent) -> int:
+    return len(content.subject) + len(content.sender) + len(content.body or "")
+
+
+def _uncached_fetch_cost(message_ids: Iterable[str]) -> int:
+    """Quota units to fetch the messages the cache can't serve (messages.get costs 5 each)."""
+    identity = current_credential_identity.get()
+    return 5 * sum(1 for message_id in message_ids if not identity or (identity, message_id) not in _MESSAGE_CACHE)
+
+
+def _get_cached_message(message_id: str) -> Optional[GmailMessageContent]:
+    """Return cached full message content for the calling account, if present."""
+    identity = current_credential_identity.get()
+    if not identity:
+        return None
+    key = (identity, message_id)
+    cached = _MESSAGE_CACHE.get(key)
+    if cached is not None:
+        _MESSAGE_CACHE.move_to_end(key)
+    return cached
+
+
+def _cache_message(content: GmailMessageContent) -> None:
+    """Remember full message content for the calling account, evicting least recently used entries."""
+    global _message_cache_chars
+    identity = current_credential_identity.get()
+    size = _message_chars(content)
+    if not identity or size > _MESSAGE_CACHE_MAX_CHARS:
+        return
+    key = (identity, content.message_id)
+    previous = _MESSAGE_CACHE.pop(key, None)
+    if previous is not None:
+        _message_cache_chars -= _message_chars(previous)
+    _MESSAGE_CACHE[key] = content
+    _message_cache_chars += size
+    while len(_MESSAGE_CACHE) > _MESSAGE_CACHE_MAX_ENTRIES or _message_cache_chars > _MESSAGE_CACHE_MAX_CHARS:
+        _, evicted = _MESSAGE_CACHE.popitem(last=False)
+        _message_cache_chars -= _message_chars(evicted)
+
+
+class _LabelModifyCoalescer:
+    """
+    Merges concurrent single-message label changes into shared API calls.
+
+    Calls are grouped by (service, labels added, labels removed); the service
+    object identifies the account, so different users' calls are never merged.
+    A call whose group has nothing in flight is sent immediately; calls arriving
+    while a request for their group runs queue up and are sent together when it
+    finishes, so an isolated call never waits.
+    """
+
+    def __init__(self, max_batch: int):
+        self._max_batch = max_batch
+        self._pending: Dict[tuple, List[Tuple[str, asyncio.Future]]] = {}
+        self._in_flight = set()
+        # Strong references to in-flight requests so they aren't garbage collected
+        self._tasks = set()
+
+    async def submit(self, service, message_id: str, adds: List[str], removes: List[str]) -> None:
+        """Queue a label change for one message and wait until it has been applied."""
+        # Label order doesn't change the result, so it mustn't split groups
+        key = (service, tuple(sorted(adds)), tuple(sorted(removes)))
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append((message_id, future))
+        if key not in self._in_flight:
+            self._dispatch(key)
+        await future
+
+    def _dispatch(self, key: tuple) -> None:
+        group = self._pending.pop(key, None)
+        if not group:
+            return
+        if len(group) > self._max_batch:
+            self._pending[key] = group[self._max_batch:]
+            group = group[:self._max_batch]
+        self._in_flight.add(key)
+        task = asyncio.ensure_future(self._run(key, group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: tuple, group: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            await self._apply(key, group)
+        finally:
+            self._in_flight.discard(key)
+            # Send the calls that queued up while this request was in flight
+            self._dispatch(key)
+
+    async def _apply(self, key: tuple, group: List[Tuple[str, asyncio.Future]]) -> None:
+        outcomes: Dict[str, Optional[BaseException]] = {}
+        failure: Optional[Exception] = None
+        try:
+            service, adds, removes = key
+            label_changes = {}
+            if adds:
+                label_changes["addLabelIds"] = list(adds)
+            if removes:
+                label_changes["removeLabelIds"] = list(removes)
+            message_ids = list(dict.fromkeys(message_id for message_id, _ in group))
+            messages_resource = service.users().messages()
+
+            if len(message_ids) >= _BATCH_MODIFY_MIN_IDS:
+                try:
+                    await run_api_call(
+                        messages_resource.batchModify(
+                            userId="me", body={"ids": message_ids, **label_changes}
+                        ).execute
+                    )
+                    outcomes = dict.fromkeys(message_ids)
+                except Exception as e:
+                    # One bad ID fails the whole batch; retry individually so only its caller sees the error
+                    logger.warning(f"[modify_gmail_message_labels] batchModify of {len(message_ids)} messages failed, retrying individually: {e}")
+
+            if not outcomes:
+                results = await asyncio.gather(
+                    *(
+                        run_api_call(
+                            messages_resource.modify(userId="me", id=message_id, body=label_changes).execute
+                        )
+                        for message_id in message_ids
+                    ),
+                    return_exceptions=True,
+                )
+                outcomes = {
+                    message_id: result if isinstance(result, BaseException) else None
+                    for message_id, result in zip(message_ids, results)
+                }
+        except Exception as e:
+            failure = e
+            logger.error(f"[modify_gmail_message_labels] Failed to apply label changes to {len(group)} messages: {e}", exc_info=True)
+        finally:
+            # Every waiting caller must be woken, even if this request failed or was cancelled
+            for message_id, future in group:
+                if future.done():
+                    continue
+                if message_id in outcomes:
+                    error = outcomes[message_id]
+                else:
+                    error = failure or RuntimeError("Label change was not applied")
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+
+_LABEL_MODIFY_COALESCER = _LabelModifyCoalescer(_BATCH_MODIFY_MAX_IDS)
 
 
 def _generate_gmail_web_url(item_id: str, account_index: int = 0):
@@ -191,22 +438,25 @@ def _generate_gmail_web_url(item_id: str, account_index: int = 0):
     Returns:
         Gmail web interface URL that opens the message/thread in Gmail web interface
     """
+    if account_index == 0:
+        return _GMAIL_URL_PREFIX + item_id
     return f"https://mail.google.com/mail/u/{account_index}/#all/{item_id}"
 
 
 def _format_gmail_search_response(messages: list, query: str) -> SearchGmailMessagesResponse:
     """Format Gmail search results as a structured response."""
-    message_refs = []
-    for msg in messages:
-        message_url = _generate_gmail_web_url(msg["id"])
-        thread_url = _generate_gmail_web_url(msg["threadId"])
-
-        message_refs.append(GmailMessageRef(
+    prefix = _GMAIL_URL_PREFIX
+    # IDs come from the API as strings, so per-item validation is skipped; the
+    # response model still validates once
+    message_refs = [
+        GmailMessageRef.model_construct(
             message_id=msg["id"],
             thread_id=msg["threadId"],
-            message_url=message_url,
-            thread_url=thread_url
-        ))
+            message_url=prefix + msg["id"],
+            thread_url=prefix + msg["threadId"]
+        )
+        for msg in messages
+    ]
 
     return SearchGmailMessagesResponse(
         query=query,
@@ -218,6 +468,7 @@ def _format_gmail_search_response(messages: list, query: str) -> SearchGmailMess
 @server.tool
 @require_google_service("gmail", "gmail_read")
 @handle_http_errors("search_gmail_messages")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=5)
 async def search_gmail_messages(
     service, ctx: Context, query: str, user_google_email: Optional[str] = None, page_size: int = 10
 ) -> SearchGmailMessagesResponse:
@@ -241,7 +492,7 @@ async def search_gmail_messages(
 
     logger.info(f"[search_gmail_messages] Email: '{user_google_email}', Query: '{query}'")
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.users()
         .messages()
         .list(userId="me", q=query, maxResults=page_size)
@@ -257,6 +508,7 @@ async def search_gmail_messages(
 @server.tool
 @require_google_service("gmail", "gmail_read")
 @handle_http_errors("get_gmail_message_content")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=lambda kwargs: _uncached_fetch_cost((kwargs.get("message_id"),)))
 async def get_gmail_message_content(
     service, ctx: Context,  message_id: str, user_google_email: Optional[str] = None
 ) -> GmailMessageContent:
@@ -282,54 +534,46 @@ async def get_gmail_message_content(
 
     logger.info(f"[get_gmail_message_content] Using service for: {user_google_email}")
 
-    # Fetch message metadata first to get headers
-    message_metadata = await asyncio.to_thread(
+    cached = _get_cached_message(message_id)
+    if cached is not None:
+        logger.info(f"[get_gmail_message_content] Returning cached content for message '{message_id}'")
+        return cached
+
+    # Fetch the full message; its payload carries both the headers and the body parts
+    message_full = await run_api_call(
         service.users()
         .messages()
         .get(
             userId="me",
             id=message_id,
-            format="metadata",
-            metadataHeaders=["Subject", "From"],
+            format="full",  # Request full payload for body
         )
         .execute
     )
 
-    headers = {
-        h["name"]: h["value"]
-        for h in message_metadata.get("payload", {}).get("headers", [])
-    }
+    payload = message_full.get("payload", {})
+    headers = _extract_headers(payload, _HEADERS_SUBJECT_FROM)
     subject = headers.get("Subject", "(no subject)")
     sender = headers.get("From", "(unknown sender)")
 
-    # Now fetch the full message to get the body parts
-    message_full = await asyncio.to_thread(
-        service.users()
-        .messages()
-        .get(
-            userId="me",
-            id=message_id,
-            format="full",  # Request full payload for body
-        )
-        .execute
-    )
-
     # Extract the plain text body using helper function
-    payload = message_full.get("payload", {})
     body_data = _extract_message_body(payload)
 
-    return GmailMessageContent(
+    content = GmailMessageContent(
         message_id=message_id,
         subject=subject,
         sender=sender,
         body=body_data or None,
         web_url=_generate_gmail_web_url(message_id)
     )
+    _cache_message(content)
+    return content
 
 
 @server.tool
 @require_google_service("gmail", "gmail_read")
 @handle_http_errors("get_gmail_messages_content_batch")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=lambda kwargs: _uncached_fetch_cost(kwargs.get("message_ids") or ()))
 async def get_gmail_messages_content_batch(
     service,
     ctx: Context,
@@ -361,40 +605,42 @@ async def get_gmail_messages_content_batch(
     if not message_ids:
         raise Exception("No message IDs provided")
 
-    retrieved_messages = []
     errors = []
 
-    # Process in chunks of 100 (Gmail batch limit)
-    for chunk_start in range(0, len(message_ids), 100):
-        chunk_ids = message_ids[chunk_start:chunk_start + 100]
-        results: Dict[str, Dict] = {}
+    # Serve previously fetched messages from the cache; a cached full message
+    # also satisfies a metadata request once its body is dropped
+    found: Dict[str, GmailMessageContent] = {}
+    ids_to_fetch = []
+    for mid in message_ids:
+        cached = _get_cached_message(mid)
+        if cached is None:
+            ids_to_fetch.append(mid)
+        else:
+            found[mid] = cached if format == "full" else cached.model_copy(update={"body": None})
+
+    # Request parameters are the same for every message apart from its ID
+    get_kwargs = {"userId": "me", "format": format}
+    if format == "metadata":
+        get_kwargs["metadataHeaders"] = ["Subject", "From"]
+    messages_resource = service.users().messages()
+
+    async def _fetch_chunk(chunk_ids: List[str]) -> List[Optional[tuple]]:
+        """Fetch one chunk of messages as (data, error) pairs in chunk order."""
+        results: List[Optional[tuple]] = [None] * len(chunk_ids)
 
         def _batch_callback(request_id, response, exception):
             """Callback for batch requests"""
-            results[request_id] = {"data": response, "error": exception}
+            results[int(request_id)] = (response, exception)
 
         # Try to use batch API
         try:
             batch = service.new_batch_http_request(callback=_batch_callback)
 
-            for mid in chunk_ids:
-                if format == "metadata":
-                    req = service.users().messages().get(
-                        userId="me",
-                        id=mid,
-                        format="metadata",
-                        metadataHeaders=["Subject", "From"]
-                    )
-                else:
-                    req = service.users().messages().get(
-                        userId="me",
-                        id=mid,
-                        format="full"
-                    )
-                batch.add(req, request_id=mid)
+            for idx, mid in enumerate(chunk_ids):
+                batch.add(messages_resource.get(id=mid, **get_kwargs), request_id=str(idx))
 
             # Execute batch request
-            await asyncio.to_thread(batch.execute)
+            await run_api_call(batch.execute)
 
         except Exception as batch_error:
             # Fallback to asyncio.gather if batch API fails
@@ -404,23 +650,8 @@ async def get_gmail_messages_content_batch(
 
             async def fetch_message(mid: str):
                 try:
-                    if format == "metadata":
-                        msg = await asyncio.to_thread(
-                            service.users().messages().get(
-                                userId="me",
-                                id=mid,
-                                format="metadata",
-                                metadataHeaders=["Subject", "From"]
-                            ).execute
-                        )
-                    else:
-                        msg = await asyncio.to_thread(
-                            service.users().messages().get(
-                                userId="me",
-                                id=mid,
-                                format="full"
-                            ).execute
-                        )
+                    async with _FALLBACK_FETCH_CONCURRENCY:
+                        msg = await run_api_call(messages_resource.get(id=mid, **get_kwargs).execute)
                     return mid, msg, None
                 except Exception as e:
                     return mid, None, e
@@ -432,20 +663,34 @@ async def get_gmail_messages_content_batch(
             )
 
             # Convert to results format
-            for mid, msg, error in fetch_results:
-                results[mid] = {"data": msg, "error": error}
+            results = [(msg, error) for _, msg, error in fetch_results]
+
+        return results
 
+    # Process in chunks of 100 (Gmail batch limit), dispatching up to
+    # _BATCH_CHUNK_CONCURRENCY chunks at once
+    chunks = [ids_to_fetch[i:i + 100] for i in range(0, len(ids_to_fetch), 100)]
+    chunk_semaphore = asyncio.Semaphore(_BATCH_CHUNK_CONCURRENCY)
+
+    async def _fetch_chunk_bounded(chunk_ids: List[str]) -> List[Optional[tuple]]:
+        async with chunk_semaphore:
+            # Concurrent chunks run on different API worker threads, and the
+            # service's pooled http keeps a connection per thread
+            return await _fetch_chunk(chunk_ids)
+
+    chunk_results = await asyncio.gather(*(_fetch_chunk_bounded(chunk_ids) for chunk_ids in chunks))
+
+    for chunk_ids, results in zip(chunks, chunk_results):
         # Process results for this chunk
-        for mid in chunk_ids:
-            entry = results.get(mid, {"data": None, "error": "No result"})
+        for mid, entry in zip(chunk_ids, results):
+            message, error = entry or (None, "No result")
 
-            if entry["error"]:
+            if error:
                 errors.append({
                     "message_id": mid,
-                    "error": str(entry["error"])
+                    "error": str(error)
                 })
             else:
-                message = entry["data"]
                 if not message:
                     errors.append({
                         "message_id": mid,
@@ -455,28 +700,33 @@ async def get_gmail_messages_content_batch(
 
                 # Extract content based on format
                 payload = message.get("payload", {})
-                headers = _extract_headers(payload, ["Subject", "From"])
+                headers = _extract_headers(payload, _HEADERS_SUBJECT_FROM)
                 subject = headers.get("Subject", "(no subject)")
                 sender = headers.get("From", "(unknown sender)")
 
+                # All fields are strings from the payload, so skip per-message validation
                 if format == "full":
                     body = _extract_message_body(payload)
-                    retrieved_messages.append(GmailMessageContent(
+                    found[mid] = GmailMessageContent.model_construct(
                         message_id=mid,
                         subject=subject,
                         sender=sender,
                         body=body or None,
                         web_url=_generate_gmail_web_url(mid)
-                    ))
+                    )
+                    _cache_message(found[mid])
                 else:
                     # For metadata format, body is not retrieved
-                    retrieved_messages.append(GmailMessageContent(
+                    found[mid] = GmailMessageContent.model_construct(
                         message_id=mid,
                         subject=subject,
                         sender=sender,
                         body=None,
                         web_url=_generate_gmail_web_url(mid)
-                    ))
+                    )
+
+    # Keep the requested order across cached and fetched messages
+    retrieved_messages = [found[mid] for mid in message_ids if mid in found]
 
     return BatchGmailMessagesResponse(
         total_requested=len(message_ids),
@@ -490,6 +740,7 @@ async def get_gmail_messages_content_batch(
 @server.tool
 @require_google_service("gmail", GMAIL_SEND_SCOPE)
 @handle_http_errors("send_gmail_message")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=100)
 async def send_gmail_message(
     service,
     ctx: Context,
@@ -515,14 +766,11 @@ async def send_gmail_message(
         SendGmailMessageResponse: Structured response with success status and message ID.
     """
     # Prepare the email
-    message = MIMEText(body)
-    message["to"] = to
-    message["subject"] = subject
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw_message = _build_raw_message(body, subject, to)
     send_body = {"raw": raw_message}
 
     # Send the email
-    sent_message = await asyncio.to_thread(
+    sent_message = await run_api_call(
         service.users().messages().send(userId="me", body=send_body).execute
     )
     message_id = sent_message.get("id")
@@ -537,6 +785,7 @@ async def send_gmail_message(
 @server.tool
 @require_google_service("gmail", GMAIL_COMPOSE_SCOPE)
 @handle_http_errors("draft_gmail_message")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=10)
 async def draft_gmail_message(
     service,
     ctx: Context,
@@ -567,21 +816,14 @@ async def draft_gmail_message(
         f"[draft_gmail_message] Invoked. Email: '{user_google_email}', Subject: '{subject}'"
     )
 
-    # Prepare the email
-    message = MIMEText(body)
-    message["subject"] = subject
-
-    # Add recipient if provided
-    if to:
-        message["to"] = to
-
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    # Prepare the email, adding the recipient if provided
+    raw_message = _build_raw_message(body, subject, to)
 
     # Create a draft instead of sending
     draft_body = {"message": {"raw": raw_message}}
 
     # Create the draft
-    created_draft = await asyncio.to_thread(
+    created_draft = await run_api_call(
         service.users().drafts().create(userId="me", body=draft_body).execute
     )
     draft_id = created_draft.get("id")
@@ -596,6 +838,7 @@ async def draft_gmail_message(
 @server.tool
 @require_google_service("gmail", "gmail_read")
 @handle_http_errors("get_gmail_thread_content")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=10)
 async def get_gmail_thread_content(
     service, ctx: Context, thread_id: str, user_google_email: Optional[str] = None
 ) -> GmailThreadContent:
@@ -620,7 +863,7 @@ async def get_gmail_thread_content(
     )
 
     # Fetch the complete thread with all messages
-    thread_response = await asyncio.to_thread(
+    thread_response = await run_api_call(
         service.users()
         .threads()
         .get(userId="me", id=thread_id, format="full")
@@ -631,37 +874,32 @@ async def get_gmail_thread_content(
     if not messages:
         raise Exception(f"No messages found in thread '{thread_id}'.")
 
-    # Extract thread subject from the first message
-    first_message = messages[0]
-    first_headers = {
-        h["name"]: h["value"]
-        for h in first_message.get("payload", {}).get("headers", [])
-    }
-    thread_subject = first_headers.get("Subject", "(no subject)")
-
     # Build the thread messages list
     thread_messages = []
+    add_message = thread_messages.append
+    thread_subject = None
 
     # Process each message in the thread
     for i, message in enumerate(messages, 1):
         # Extract headers
-        headers = {
-            h["name"]: h["value"]
-            for h in message.get("payload", {}).get("headers", [])
-        }
+        payload = message.get("payload", {})
+        headers = _extract_headers(payload, _HEADERS_THREAD)
 
         sender = headers.get("From", "(unknown sender)")
         date = headers.get("Date", "(unknown date)")
         subject = headers.get("Subject", "(no subject)")
 
+        # The thread subject is the first message's subject
+        if thread_subject is None:
+            thread_subject = subject
+
         # Extract message body
-        payload = message.get("payload", {})
         body_data = _extract_message_body(payload)
 
         # Only include subject if it's different from thread subject
         msg_subject = subject if subject != thread_subject else None
 
-        thread_messages.append(GmailThreadMessage(
+        add_message(GmailThreadMessage.model_construct(
             message_number=i,
             sender=sender,
             date=date,
@@ -680,6 +918,7 @@ async def get_gmail_thread_content(
 @server.tool
 @require_google_service("gmail", "gmail_read")
 @handle_http_errors("list_gmail_labels")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=1)
 async def list_gmail_labels(service, ctx: Context, user_google_email: Optional[str] = None) -> ListGmailLabelsResponse:
     """
     <description>Lists all Gmail labels including system labels (Inbox, Sent, Drafts) and user-created custom labels, showing label IDs and names for organization and filtering.</description>
@@ -698,26 +937,23 @@ async def list_gmail_labels(service, ctx: Context, user_google_email: Optional[s
     """
     logger.info(f"[list_gmail_labels] Invoked. Email: '{user_google_email}'")
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.users().labels().list(userId="me").execute
     )
     labels = response.get("labels", [])
 
     system_labels = []
     user_labels = []
+    add_system, add_user = system_labels.append, user_labels.append
 
+    # Label fields are API strings, so skip per-label validation
     for label in labels:
         label_type = label.get("type", "user")
-        gmail_label = GmailLabel(
+        (add_system if label_type == "system" else add_user)(GmailLabel.model_construct(
             label_id=label["id"],
             name=label["name"],
             label_type=label_type
-        )
-
-        if label_type == "system":
-            system_labels.append(gmail_label)
-        else:
-            user_labels.append(gmail_label)
+        ))
 
     return ListGmailLabelsResponse(
         total_labels=len(labels),
@@ -729,6 +965,7 @@ async def list_gmail_labels(service, ctx: Context, user_google_email: Optional[s
 @server.tool
 @require_google_service("gmail", GMAIL_LABELS_SCOPE)
 @handle_http_errors("manage_gmail_label")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=5)
 async def manage_gmail_label(
     service,
     ctx: Context,
@@ -736,8 +973,9 @@ async def manage_gmail_label(
     name: Optional[str] = None,
     label_id: Optional[str] = None,
     user_google_email: Optional[str] = None,
-    label_list_visibility: Literal["labelShow", "labelHide"] = "labelShow",
-    message_list_visibility: Literal["show", "hide"] = "show",
+    label_list_visibility: Optional[Literal["labelShow", "labelHide"]] = None,
+    message_list_visibility: Optional[Literal["show", "hide"]] = None,
+    return_name: bool = False,
 ) -> ManageGmailLabelResponse:
     """
     Manages Gmail labels: create, update, or delete labels.
@@ -747,8 +985,9 @@ async def manage_gmail_label(
         action (Literal["create", "update", "delete"]): Action to perform on the label.
         name (Optional[str]): Label name. Required for create, optional for update.
         label_id (Optional[str]): Label ID. Required for update and delete operations.
-        label_list_visibility (Literal["labelShow", "labelHide"]): Whether the label is shown in the label list.
-        message_list_visibility (Literal["show", "hide"]): Whether the label is shown in the message list.
+        label_list_visibility (Optional[Literal["labelShow", "labelHide"]]): Whether the label is shown in the label list. Defaults to "labelShow" on create; left unchanged on update if omitted.
+        message_list_visibility (Optional[Literal["show", "hide"]]): Whether the label is shown in the message list. Defaults to "show" on create; left unchanged on update if omitted.
+        return_name (bool): On delete, look up the label's name first so the response can report it. Costs an extra API call. Defaults to False.
 
     Returns:
         ManageGmailLabelResponse: Structured response with operation result.
@@ -764,10 +1003,10 @@ async def manage_gmail_label(
     if action == "create":
         label_object = {
             "name": name,
-            "labelListVisibility": label_list_visibility,
-            "messageListVisibility": message_list_visibility,
+            "labelListVisibility": label_list_visibility or "labelShow",
+            "messageListVisibility": message_list_visibility or "show",
         }
-        created_label = await asyncio.to_thread(
+        created_label = await run_api_call(
             service.users().labels().create(userId="me", body=label_object).execute
         )
         return ManageGmailLabelResponse(
@@ -779,19 +1018,19 @@ async def manage_gmail_label(
         )
 
     elif action == "update":
-        current_label = await asyncio.to_thread(
-            service.users().labels().get(userId="me", id=label_id).execute
-        )
-
-        label_object = {
-            "id": label_id,
-            "name": name if name is not None else current_label["name"],
-            "labelListVisibility": label_list_visibility,
-            "messageListVisibility": message_list_visibility,
-        }
-
-        updated_label = await asyncio.to_thread(
-            service.users().labels().update(userId="me", id=label_id, body=label_object).execute
+        # patch only touches the supplied fields, so no read is needed to preserve the rest
+        label_object = {}
+        if name is not None:
+            label_object["name"] = name
+        if label_list_visibility is not None:
+            label_object["labelListVisibility"] = label_list_visibility
+        if message_list_visibility is not None:
+            label_object["messageListVisibility"] = message_list_visibility
+        if not label_object:
+            raise Exception("At least one of name, label_list_visibility or message_list_visibility is required for update action.")
+
+        updated_label = await run_api_call(
+            service.users().labels().patch(userId="me", id=label_id, body=label_object).execute
         )
         return ManageGmailLabelResponse(
             success=True,
@@ -802,12 +1041,14 @@ async def manage_gmail_label(
         )
 
     elif action == "delete":
-        label = await asyncio.to_thread(
-            service.users().labels().get(userId="me", id=label_id).execute
-        )
-        label_name = label["name"]
+        label_name = name or label_id
+        if return_name:
+            label = await run_api_call(
+                service.users().labels().get(userId="me", id=label_id).execute
+            )
+            label_name = label["name"]
 
-        await asyncio.to_thread(
+        await run_api_call(
             service.users().labels().delete(userId="me", id=label_id).execute
         )
         return ManageGmailLabelResponse(
@@ -822,6 +1063,7 @@ async def manage_gmail_label(
 @server.tool
 @require_google_service("gmail", GMAIL_MODIFY_SCOPE)
 @handle_http_errors("modify_gmail_message_labels")
+@rate_limited("gmail", _GMAIL_QUOTA_UNITS, 1, cost=5)
 async def modify_gmail_message_labels(
     service,
     ctx: Context,
@@ -847,15 +1089,98 @@ async def modify_gmail_message_labels(
     if not add_label_ids and not remove_label_ids:
         raise Exception("At least one of add_label_ids or remove_label_ids must be provided.")
 
-    body = {}
+    # Drop duplicates, and labels that are both added and removed: they cancel
+    # out, and the API rejects overlapping lists
+    overlap = set(add_label_ids or ()).intersection(remove_label_ids or ())
+    adds = [label for label in dict.fromkeys(add_label_ids or ()) if label not in overlap]
+    removes = [label for label in dict.fromkeys(remove_label_ids or ()) if label not in overlap]
+
+    if not adds and not removes:
+        logger.info(f"[modify_gmail_message_labels] Label changes cancel out for message {message_id}; skipping API call")
+        return ModifyGmailMessageLabelsResponse(
+            success=True,
+            message_id=message_id,
+            message="No label changes to apply: every label was both added and removed"
+        )
+
+    # Concurrent calls making the same change are merged into shared API calls
+    await _LABEL_MODIFY_COALESCER.submit(service, message_id, adds, removes)
+
+    actions = []
+    if adds:
+        actions.append(f"added {len(adds)} label(s)")
+    if removes:
+        actions.append(f"removed {len(removes)} label(s)")
+
+    return ModifyGmailMessageLabelsResponse(
+        success=True,
+        message_id=message_id,
+        added_labels=adds,
+        removed_labels=removes,
+        message=f"Message labels updated: {', '.join(actions)}"
+    )
+
+
+@server.tool
+@require_google_service("gmail", GMAIL_MODIFY_SCOPE)
+@handle_http_errors("batch_modify_gmail_messages")
+@rate_limited(
+    "gmail", _GMAIL_QUOTA_UNITS, 1,
+    cost=lambda kwargs: 50 * -(-len(kwargs.get("message_ids") or ()) // _BATCH_MODIFY_MAX_IDS),
+)
+async def batch_modify_gmail_messages(
+    service,
+    ctx: Context,
+    message_ids: List[str],
+    add_label_ids: Optional[List[str]] = None,
+    remove_label_ids: Optional[List[str]] = None,
+    user_google_email: Optional[str] = None,
+) -> BatchModifyGmailMessagesResponse:
+    """
+    Adds or removes labels on many Gmail messages at once.
+
+    Uses messages.batchModify, which updates up to 1000 messages per API call;
+    larger lists are split into 1000-message chunks sent concurrently.
+
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. Optional.
+        message_ids (List[str]): IDs of the messages to modify.
+        add_label_ids (Optional[List[str]]): List of label IDs to add to every message.
+        remove_label_ids (Optional[List[str]]): List of label IDs to remove from every message.
+
+    Returns:
+        BatchModifyGmailMessagesResponse: Structured response with label modification details.
+    """
+    logger.info(f"[batch_modify_gmail_messages] Invoked. Email: '{user_google_email}', Message count: {len(message_ids)}")
+
+    if not message_ids:
+        raise Exception("No message IDs provided.")
+
+    if not add_label_ids and not remove_label_ids:
+        raise Exception("At least one of add_label_ids or remove_label_ids must be provided.")
+
+    label_changes = {}
     if add_label_ids:
-        body["addLabelIds"] = add_label_ids
+        label_changes["addLabelIds"] = add_label_ids
     if remove_label_ids:
-        body["removeLabelIds"] = remove_label_ids
+        label_changes["removeLabelIds"] = remove_label_ids
+
+    chunks = [
+        message_ids[i:i + _BATCH_MODIFY_MAX_IDS]
+        for i in range(0, len(message_ids), _BATCH_MODIFY_MAX_IDS)
+    ]
+    messages_resource = service.users().messages()
+
+    async def _modify_chunk(chunk_ids: List[str]) -> None:
+        # Concurrent chunks run on different API worker threads, and the service's
+        # pooled http keeps a connection per thread, so they can share it safely
+        # and reuse its keep-alive connections
+        request = messages_resource.batchModify(
+            userId="me", body={"ids": chunk_ids, **label_changes}
+        )
+        await run_api_call(request.execute)
 
-    await asyncio.to_thread(
-        service.users().messages().modify(userId="me", id=message_id, body=body).execute
-    )
+    await asyncio.gather(*(_modify_chunk(chunk_ids) for chunk_ids in chunks))
 
     actions = []
     if add_label_ids:
@@ -863,10 +1188,11 @@ async def modify_gmail_message_labels(
     if remove_label_ids:
         actions.append(f"removed {len(remove_label_ids)} label(s)")
 
-    return ModifyGmailMessageLabelsResponse(
+    logger.info(f"[batch_modify_gmail_messages] Modified {len(message_ids)} messages in {len(chunks)} request(s)")
+    return BatchModifyGmailMessagesResponse(
         success=True,
-        message_id=message_id,
+        message_count=len(message_ids),
         added_labels=add_label_ids or [],
         removed_labels=remove_label_ids or [],
-        message=f"Message labels updated: {', '.join(actions)}"
+        message=f"Labels updated on {len(message_ids)} messages: {', '.join(actions)}"
     )
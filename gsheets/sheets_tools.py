@@ -6,20 +6,35 @@ This module provides MCP tools for interacting with Google Sheets API.
 
 import logging
 import asyncio
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp import types
 from googleapiclient.errors import HttpError
 
 from auth.service_decorator import require_google_service
 from core.server import server
-from core.utils import handle_http_errors
+from core.utils import handle_http_errors, rate_limited, run_api_call
 from core.comments import create_comment_tools
 from fastmcp import Context
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Sheets API per-user quotas (requests per minute); 300/min is the per-project read limit
+_SHEETS_READ_QUOTA = 60
+_SHEETS_WRITE_QUOTA = 60
+
+# Largest page Drive's files.list will return
+_DRIVE_LIST_PAGE_SIZE = 1000
+
+# Drive query and field mask used by list_spreadsheets
+_SPREADSHEET_QUERY = "mimeType='application/vnd.google-apps.spreadsheet'"
+_SPREADSHEET_LIST_FIELDS = "nextPageToken,files(id,name,modifiedTime,webViewLink)"
+
+# get_spreadsheet_info only formats these; without a mask the API returns every
+# sheet's formatting, protected ranges, named ranges, etc.
+_SPREADSHEET_INFO_FIELDS = "properties.title,sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))"
+
 
 @server.tool
 @require_google_service("drive", "drive_read")
@@ -41,45 +56,61 @@ async def list_spreadsheets(
 
     Args:
         user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
-        max_results (int): Maximum number of spreadsheets to return. Defaults to 25.
+        max_results (int): Maximum number of spreadsheets to return. Results beyond one page are fetched automatically. Defaults to 25.
 
     Returns:
         str: A formatted list of spreadsheet files (name, ID, modified time).
     """
-    logger.info(f"[list_spreadsheets] Invoked. Email: '{user_google_email}'")
-
-    files_response = await asyncio.to_thread(
-        service.files()
-        .list(
-            q="mimeType='application/vnd.google-apps.spreadsheet'",
-            pageSize=max_results,
-            fields="files(id,name,modifiedTime,webViewLink)",
+    logger.info("[list_spreadsheets] Invoked. Email: '%s'", user_google_email)
+
+    files_resource = service.files()
+
+    def _page_request(page_token: Optional[str], remaining: int):
+        return files_resource.list(
+            q=_SPREADSHEET_QUERY,
+            pageSize=min(_DRIVE_LIST_PAGE_SIZE, remaining),
+            pageToken=page_token,
+            fields=_SPREADSHEET_LIST_FIELDS,
             orderBy="modifiedTime desc",
+        ).execute
+
+    spreadsheets_list = []
+    files_response = await run_api_call(_page_request(None, max_results))
+    while True:
+        files = files_response.get("files", [])[:max_results - len(spreadsheets_list)]
+        remaining = max_results - len(spreadsheets_list) - len(files)
+        page_token = files_response.get("nextPageToken")
+
+        # Fetch the next page while this one is formatted
+        next_page = None
+        if remaining > 0 and page_token:
+            next_page = asyncio.ensure_future(run_api_call(_page_request(page_token, remaining)))
+
+        spreadsheets_list.extend(
+            f"- \"{file['name']}\" (ID: {file['id']}) | Modified: {file.get('modifiedTime', 'Unknown')} | Link: {file.get('webViewLink', 'No link')}"
+            for file in files
         )
-        .execute
-    )
 
-    files = files_response.get("files", [])
-    if not files:
-        return f"No spreadsheets found for {user_google_email}."
+        if next_page is None:
+            break
+        files_response = await next_page
 
-    spreadsheets_list = [
-        f"- \"{file['name']}\" (ID: {file['id']}) | Modified: {file.get('modifiedTime', 'Unknown')} | Link: {file.get('webViewLink', 'No link')}"
-        for file in files
-    ]
+    if not spreadsheets_list:
+        return f"No spreadsheets found for {user_google_email}."
 
     text_output = (
-        f"Successfully listed {len(files)} spreadsheets for {user_google_email}:\n"
+        f"Successfully listed {len(spreadsheets_list)} spreadsheets for {user_google_email}:\n"
         + "\n".join(spreadsheets_list)
     )
 
-    logger.info(f"Successfully listed {len(files)} spreadsheets for {user_google_email}.")
+    logger.info("Successfully listed %s spreadsheets for %s.", len(spreadsheets_list), user_google_email)
     return text_output
 
 
 @server.tool
 @require_google_service("sheets", "sheets_read")
 @handle_http_errors("get_spreadsheet_info")
+@rate_limited("sheets_read", _SHEETS_READ_QUOTA)
 async def get_spreadsheet_info(
     service,
     ctx: Context,
@@ -102,10 +133,12 @@ async def get_spreadsheet_info(
     Returns:
         str: Formatted spreadsheet information including title and sheets list.
     """
-    logger.info(f"[get_spreadsheet_info] Invoked. Email: '{user_google_email}', Spreadsheet ID: {spreadsheet_id}")
+    logger.info("[get_spreadsheet_info] Invoked. Email: '%s', Spreadsheet ID: %s", user_google_email, spreadsheet_id)
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+    spreadsheet = await run_api_call(
+        service.spreadsheets()
+        .get(spreadsheetId=spreadsheet_id, fields=_SPREADSHEET_INFO_FIELDS)
+        .execute
     )
 
     title = spreadsheet.get("properties", {}).get("title", "Unknown")
@@ -130,13 +163,60 @@ async def get_spreadsheet_info(
         + "\n".join(sheets_info) if sheets_info else "  No sheets found"
     )
 
-    logger.info(f"Successfully retrieved info for spreadsheet {spreadsheet_id} for {user_google_email}.")
+    logger.info("Successfully retrieved info for spreadsheet %s for %s.", spreadsheet_id, user_google_email)
     return text_output
 
 
+async def _batch_get_values(
+    service,
+    spreadsheet_id: str,
+    ranges: List[str],
+    major_dimension: str = "ROWS",
+    value_render_option: Optional[str] = None,
+) -> List[Tuple[str, List[List[Any]]]]:
+    """
+    Read several ranges with a single values.batchGet call.
+
+    Returns (requested range, rows) pairs in request order, one per requested
+    range, so repeated ranges are each reported. The API echoes back normalized
+    range names (e.g. "Sheet1!A1:Z1000"), so results are correlated with the
+    request by position rather than by name.
+    """
+    result = await run_api_call(
+        service.spreadsheets()
+        .values()
+        .batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            majorDimension=major_dimension,
+            valueRenderOption=value_render_option,
+        )
+        .execute
+    )
+
+    value_ranges = result.get("valueRanges", [])
+    return [
+        (range_name, value_ranges[i].get("values", []) if i < len(value_ranges) else [])
+        for i, range_name in enumerate(ranges)
+    ]
+
+
+def _format_values(values: List[List[Any]]) -> str:
+    """Format rows as a readable table, padding short rows to the header width."""
+    if not values:
+        return ""
+    width = len(values[0])
+    # Pad short rows with empty strings to show structure; full rows are used as-is
+    return "\n".join(
+        f"Row {i:2d}: {row if len(row) >= width else row + [''] * (width - len(row))}"
+        for i, row in enumerate(values, 1)
+    )
+
+
 @server.tool
 @require_google_service("sheets", "sheets_read")
 @handle_http_errors("read_sheet_values")
+@rate_limited("sheets_read", _SHEETS_READ_QUOTA)
 async def read_sheet_values(
     service,
     ctx: Context,
@@ -160,38 +240,116 @@ async def read_sheet_values(
     Returns:
         str: The formatted values from the specified range.
     """
-    logger.info(f"[read_sheet_values] Invoked. Email: '{user_google_email}', Spreadsheet: {spreadsheet_id}, Range: {range_name}")
+    logger.info("[read_sheet_values] Invoked. Email: '%s', Spreadsheet: %s, Range: %s", user_google_email, spreadsheet_id, range_name)
 
-    result = await asyncio.to_thread(
-        service.spreadsheets()
-        .values()
-        .get(spreadsheetId=spreadsheet_id, range=range_name)
-        .execute
-    )
-
-    values = result.get("values", [])
+    [(_, values)] = await _batch_get_values(service, spreadsheet_id, [range_name])
     if not values:
         return f"No data found in range '{range_name}' for {user_google_email}."
 
-    # Format the output as a readable table
-    formatted_rows = []
-    for i, row in enumerate(values, 1):
-        # Pad row with empty strings to show structure
-        padded_row = row + [""] * max(0, len(values[0]) - len(row)) if values else row
-        formatted_rows.append(f"Row {i:2d}: {padded_row}")
-
     text_output = (
         f"Successfully read {len(values)} rows from range '{range_name}' in spreadsheet {spreadsheet_id} for {user_google_email}:\n"
-        + "\n".join(formatted_rows)
+        + _format_values(values)
     )
 
-    logger.info(f"Successfully read {len(values)} rows for {user_google_email}.")
+    logger.info("Successfully read %s rows for %s.", len(values), user_google_email)
     return text_output
 
 
+@server.tool
+@require_google_service("sheets", "sheets_read")
+@handle_http_errors("read_sheet_values_batch")
+@rate_limited("sheets_read", _SHEETS_READ_QUOTA)
+async def read_sheet_values_batch(
+    service,
+    ctx: Context,
+    spreadsheet_id: str,
+    ranges: List[str],
+    user_google_email: Optional[str] = None,
+    major_dimension: str = "ROWS",
+    value_render_option: Optional[str] = None,
+):
+    """
+    <description>Reads cell values from several ranges of one Google Sheets spreadsheet in a single request, returning each range's data as a formatted table labelled with the requested range.</description>
+    
+    <use_case>Pulling multiple tables or sheets at once for comparison, reading a header row and a data block together, or gathering scattered ranges without one round-trip per range.</use_case>
+    
+    <limitation>All ranges must belong to the same spreadsheet. Large ranges still count toward response size limits. Returns calculated values unless value_render_option requests formulas.</limitation>
+    
+    <failure_cases>Fails if any range specification is invalid, with invalid spreadsheet IDs, or when the user lacks read access to the spreadsheet.</failure_cases>
+
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
+        spreadsheet_id (str): The ID of the spreadsheet. Required.
+        ranges (List[str]): The ranges to read (e.g., ["Sheet1!A1:D10", "Sheet2!A:A"]). Required.
+        major_dimension (str): "ROWS" or "COLUMNS". Defaults to "ROWS".
+        value_render_option (Optional[str]): "FORMATTED_VALUE", "UNFORMATTED_VALUE", or "FORMULA". Defaults to the API default (FORMATTED_VALUE).
+
+    Returns:
+        str: The formatted values for each requested range.
+    """
+    logger.info("[read_sheet_values_batch] Invoked. Email: '%s', Spreadsheet: %s, Ranges: %s", user_google_email, spreadsheet_id, ranges)
+
+    if not ranges:
+        raise Exception("At least one range must be provided.")
+
+    range_values = await _batch_get_values(
+        service, spreadsheet_id, ranges, major_dimension, value_render_option
+    )
+
+    sections = []
+    for range_name, values in range_values:
+        if values:
+            sections.append(f"Range '{range_name}' ({len(values)} rows):\n{_format_values(values)}")
+        else:
+            sections.append(f"Range '{range_name}': No data found.")
+
+    text_output = (
+        f"Successfully read {len(range_values)} ranges from spreadsheet {spreadsheet_id} for {user_google_email}:\n\n"
+        + "\n\n".join(sections)
+    )
+
+    logger.info("Successfully read %s ranges for %s.", len(range_values), user_google_email)
+    return text_output
+
+
+async def _batch_update_values(
+    service,
+    spreadsheet_id: str,
+    updates: List[Dict[str, Any]],
+    value_input_option: str = "USER_ENTERED",
+) -> Dict[str, Any]:
+    """Write several ranges with a single values.batchUpdate call (one write-quota unit)."""
+    body = {"valueInputOption": value_input_option, "data": updates}
+    return await run_api_call(
+        service.spreadsheets()
+        .values()
+        .batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=body,
+            fields="totalUpdatedCells,totalUpdatedRows,totalUpdatedColumns",
+        )
+        .execute
+    )
+
+
+async def _batch_clear_values(
+    service,
+    spreadsheet_id: str,
+    ranges: List[str],
+) -> Dict[str, Any]:
+    """Clear several ranges with a single values.batchClear call."""
+    return await run_api_call(
+        service.spreadsheets()
+        .values()
+        .batchClear(spreadsheetId=spreadsheet_id, body={"ranges": ranges}, fields="clearedRanges")
+        .execute
+    )
+
+
 @server.tool
 @require_google_service("sheets", "sheets_write")
 @handle_http_errors("modify_sheet_values")
+@rate_limited("sheets_write", _SHEETS_WRITE_QUOTA)
 async def modify_sheet_values(
     service,
     ctx: Context,
@@ -223,53 +381,173 @@ async def modify_sheet_values(
         str: Confirmation message of the successful modification operation.
     """
     operation = "clear" if clear_values else "write"
-    logger.info(f"[modify_sheet_values] Invoked. Operation: {operation}, Email: '{user_google_email}', Spreadsheet: {spreadsheet_id}, Range: {range_name}")
+    logger.info("[modify_sheet_values] Invoked. Operation: %s, Email: '%s', Spreadsheet: %s, Range: %s", operation, user_google_email, spreadsheet_id, range_name)
 
     if not clear_values and not values:
         raise Exception("Either 'values' must be provided or 'clear_values' must be True.")
 
     if clear_values:
-        result = await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .clear(spreadsheetId=spreadsheet_id, range=range_name)
-            .execute
-        )
+        result = await _batch_clear_values(service, spreadsheet_id, [range_name])
 
-        cleared_range = result.get("clearedRange", range_name)
+        cleared_ranges = result.get("clearedRanges") or [range_name]
+        cleared_range = cleared_ranges[0]
         text_output = f"Successfully cleared range '{cleared_range}' in spreadsheet {spreadsheet_id} for {user_google_email}."
-        logger.info(f"Successfully cleared range '{cleared_range}' for {user_google_email}.")
+        logger.info("Successfully cleared range '%s' for %s.", cleared_range, user_google_email)
     else:
-        body = {"values": values}
-
-        result = await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption=value_input_option,
-                body=body,
-            )
-            .execute
+        result = await _batch_update_values(
+            service,
+            spreadsheet_id,
+            [{"range": range_name, "values": values}],
+            value_input_option,
         )
 
-        updated_cells = result.get("updatedCells", 0)
-        updated_rows = result.get("updatedRows", 0)
-        updated_columns = result.get("updatedColumns", 0)
+        updated_cells = result.get("totalUpdatedCells", 0)
+        updated_rows = result.get("totalUpdatedRows", 0)
+        updated_columns = result.get("totalUpdatedColumns", 0)
 
         text_output = (
             f"Successfully updated range '{range_name}' in spreadsheet {spreadsheet_id} for {user_google_email}. "
             f"Updated: {updated_cells} cells, {updated_rows} rows, {updated_columns} columns."
         )
-        logger.info(f"Successfully updated {updated_cells} cells for {user_google_email}.")
+        logger.info("Successfully updated %s cells for %s.", updated_cells, user_google_email)
 
     return text_output
 
 
+@server.tool
+@require_google_service("sheets", "sheets_write")
+@handle_http_errors("modify_sheet_values_batch")
+@rate_limited("sheets_write", _SHEETS_WRITE_QUOTA)
+async def modify_sheet_values_batch(
+    service,
+    ctx: Context,
+    spreadsheet_id: str,
+    user_google_email: Optional[str] = None,
+    updates: Optional[List[Dict[str, Any]]] = None,
+    value_input_option: str = "USER_ENTERED",
+    clear_ranges: Optional[List[str]] = None,
+):
+    """
+    <description>Writes values to several ranges, or clears several ranges, of one Google Sheets spreadsheet in a single request. Each update pairs a range with a 2D array of values.</description>
+    
+    <use_case>Filling multiple tables or sheets at once, writing scattered cells from one calculation, or resetting several ranges together without spending one write request per range.</use_case>
+    
+    <limitation>All ranges must belong to the same spreadsheet. Writes and clears are separate requests when both are given. Overwrites existing data within each specified range.</limitation>
+    
+    <failure_cases>Fails if any range is invalid, with insufficient edit permissions on protected sheets, or when an update is missing its range or values.</failure_cases>
+
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
+        spreadsheet_id (str): The ID of the spreadsheet. Required.
+        updates (Optional[List[Dict[str, Any]]]): Ranges to write, e.g. [{"range": "Sheet1!A1:B2", "values": [["a", "b"], ["c", "d"]]}]. Required unless clear_ranges is given.
+        value_input_option (str): How to interpret input values ("RAW" or "USER_ENTERED"). Defaults to "USER_ENTERED".
+        clear_ranges (Optional[List[str]]): Ranges to clear (e.g., ["Sheet1!A1:D10", "Sheet2!A:A"]).
+
+    Returns:
+        str: Confirmation message summarizing the writes and clears.
+    """
+    logger.info("[modify_sheet_values_batch] Invoked. Email: '%s', Spreadsheet: %s, Updates: %s, Clears: %s", user_google_email, spreadsheet_id, len(updates or []), len(clear_ranges or []))
+
+    if not updates and not clear_ranges:
+        raise Exception("Either 'updates' or 'clear_ranges' must be provided.")
+
+    data = []
+    for update in updates or []:
+        if not update.get("range") or not update.get("values"):
+            raise Exception(f"Each update needs a 'range' and non-empty 'values': {update}")
+        data.append({"range": update["range"], "values": update["values"]})
+
+    summary = []
+    if data:
+        result = await _batch_update_values(service, spreadsheet_id, data, value_input_option)
+        updated_cells = result.get("totalUpdatedCells", 0)
+        summary.append(
+            f"Updated {len(data)} ranges: {updated_cells} cells, "
+            f"{result.get('totalUpdatedRows', 0)} rows, {result.get('totalUpdatedColumns', 0)} columns."
+        )
+        logger.info("Successfully updated %s cells across %s ranges for %s.", updated_cells, len(data), user_google_email)
+
+    if clear_ranges:
+        result = await _batch_clear_values(service, spreadsheet_id, clear_ranges)
+        cleared = result.get("clearedRanges") or clear_ranges
+        summary.append(f"Cleared {len(cleared)} ranges: {', '.join(cleared)}.")
+        logger.info("Successfully cleared %s ranges for %s.", len(cleared), user_google_email)
+
+    text_output = (
+        f"Successfully modified spreadsheet {spreadsheet_id} for {user_google_email}. "
+        + " ".join(summary)
+    )
+    return text_output
+
+
+@server.tool
+@require_google_service("sheets", "sheets_write")
+@handle_http_errors("append_sheet_values")
+@rate_limited("sheets_write", _SHEETS_WRITE_QUOTA)
+async def append_sheet_values(
+    service,
+    ctx: Context,
+    spreadsheet_id: str,
+    range_name: str,
+    values: List[List[str]],
+    user_google_email: Optional[str] = None,
+    value_input_option: str = "USER_ENTERED",
+):
+    """
+    <description>Appends rows after the last row of data in a Google Sheets table, inserting new rows so nothing below is overwritten. The server finds the end of the table, so no row index needs to be known.</description>
+    
+    <use_case>Logging events or form-style entries, adding new records to a growing dataset, or accumulating results over time without reading the sheet first to find the next empty row.</use_case>
+    
+    <limitation>The table is detected from the given range; gaps in data can make the API pick an earlier table. Cannot append to protected ranges without edit permissions.</limitation>
+    
+    <failure_cases>Fails with invalid spreadsheet IDs or range specifications, insufficient edit permissions on protected sheets, or empty values.</failure_cases>
+
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
+        spreadsheet_id (str): The ID of the spreadsheet. Required.
+        range_name (str): A range within the table to append to (e.g., "Sheet1!A:D", "Sheet1"). Required.
+        values (List[List[str]]): 2D array of rows to append. Required.
+        value_input_option (str): How to interpret input values ("RAW" or "USER_ENTERED"). Defaults to "USER_ENTERED".
+
+    Returns:
+        str: Confirmation message with the range the rows were written to.
+    """
+    logger.info("[append_sheet_values] Invoked. Email: '%s', Spreadsheet: %s, Range: %s, Rows: %s", user_google_email, spreadsheet_id, range_name, len(values or []))
+
+    if not values:
+        raise Exception("'values' must contain at least one row to append.")
+
+    result = await run_api_call(
+        service.spreadsheets()
+        .values()
+        .append(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            valueInputOption=value_input_option,
+            insertDataOption="INSERT_ROWS",
+            body={"values": values},
+            fields="updates(updatedRange,updatedRows,updatedCells)",
+        )
+        .execute
+    )
+
+    updates = result.get("updates", {})
+    updated_range = updates.get("updatedRange", range_name)
+    updated_rows = updates.get("updatedRows", 0)
+    updated_cells = updates.get("updatedCells", 0)
+
+    text_output = (
+        f"Successfully appended {updated_rows} rows to '{updated_range}' in spreadsheet {spreadsheet_id} for {user_google_email}. "
+        f"Updated: {updated_cells} cells."
+    )
+    logger.info("Successfully appended %s rows for %s.", updated_rows, user_google_email)
+    return text_output
+
+
 @server.tool
 @require_google_service("sheets", "sheets_write")
 @handle_http_errors("create_spreadsheet")
+@rate_limited("sheets_write", _SHEETS_WRITE_QUOTA)
 async def create_spreadsheet(
     service,
     ctx: Context,
@@ -294,7 +572,7 @@ async def create_spreadsheet(
     Returns:
         str: Information about the newly created spreadsheet including ID and URL.
     """
-    logger.info(f"[create_spreadsheet] Invoked. Email: '{user_google_email}', Title: {title}")
+    logger.info("[create_spreadsheet] Invoked. Email: '%s', Title: %s", user_google_email, title)
 
     spreadsheet_body = {
         "properties": {
@@ -307,8 +585,10 @@ async def create_spreadsheet(
             {"properties": {"title": sheet_name}} for sheet_name in sheet_names
         ]
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().create(body=spreadsheet_body).execute
+    spreadsheet = await run_api_call(
+        service.spreadsheets()
+        .create(body=spreadsheet_body, fields="spreadsheetId,spreadsheetUrl,properties.title")
+        .execute
     )
 
     spreadsheet_id = spreadsheet.get("spreadsheetId")
@@ -319,64 +599,81 @@ async def create_spreadsheet(
         f"ID: {spreadsheet_id} | URL: {spreadsheet_url}"
     )
 
-    logger.info(f"Successfully created spreadsheet for {user_google_email}. ID: {spreadsheet_id}")
+    logger.info("Successfully created spreadsheet for %s. ID: %s", user_google_email, spreadsheet_id)
     return text_output
 
 
 @server.tool
 @require_google_service("sheets", "sheets_write")
 @handle_http_errors("create_sheet")
+@rate_limited("sheets_write", _SHEETS_WRITE_QUOTA)
 async def create_sheet(
     service,
     ctx: Context,
     spreadsheet_id: str,
-    sheet_name: str,
+    sheet_name: Optional[str] = None,
     user_google_email: Optional[str] = None,
+    sheet_names: Optional[List[str]] = None,
 ):
     """
-    <description>Adds a new empty sheet tab to an existing Google Sheets spreadsheet with specified name. Creates a standard 1000x26 grid ready for data entry within the existing workbook.</description>
+    <description>Adds one or more new empty sheet tabs to an existing Google Sheets spreadsheet with specified names. Creates standard 1000x26 grids ready for data entry within the existing workbook, all in a single request.</description>
     
     <use_case>Organizing data into separate sheets within a workbook, creating monthly/quarterly data tabs, or setting up different data categories in the same spreadsheet.</use_case>
     
-    <limitation>Cannot create sheets with duplicate names within the same spreadsheet. Limited to 200 sheets per spreadsheet. Creates empty sheet only - no data or formatting.</limitation>
+    <limitation>Cannot create sheets with duplicate names within the same spreadsheet. Limited to 200 sheets per spreadsheet. Creates empty sheets only - no data or formatting.</limitation>
     
-    <failure_cases>Fails with invalid spreadsheet IDs, duplicate sheet names within the spreadsheet, insufficient edit permissions, or when spreadsheet already has maximum sheet count.</failure_cases>
+    <failure_cases>Fails with invalid spreadsheet IDs, duplicate sheet names within the spreadsheet, insufficient edit permissions, or when spreadsheet already has maximum sheet count. If any name is rejected, no sheets are created.</failure_cases>
 
     Args:
         user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
         spreadsheet_id (str): The ID of the spreadsheet. Required.
-        sheet_name (str): The name of the new sheet. Required.
+        sheet_name (Optional[str]): The name of a single new sheet. Required unless sheet_names is given.
+        sheet_names (Optional[List[str]]): Names of several new sheets to add in one request.
 
     Returns:
         str: Confirmation message of the successful sheet creation.
     """
-    logger.info(f"[create_sheet] Invoked. Email: '{user_google_email}', Spreadsheet: {spreadsheet_id}, Sheet: {sheet_name}")
+    names = list(sheet_names or [])
+    if sheet_name:
+        names.insert(0, sheet_name)
+    logger.info("[create_sheet] Invoked. Email: '%s', Spreadsheet: %s, Sheets: %s", user_google_email, spreadsheet_id, names)
+
+    if not names:
+        raise Exception("Either 'sheet_name' or 'sheet_names' must be provided.")
 
     request_body = {
         "requests": [
-            {
-                "addSheet": {
-                    "properties": {
-                        "title": sheet_name
-                    }
-                }
-            }
+            {"addSheet": {"properties": {"title": name}}} for name in names
         ]
     }
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
+        .batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=request_body,
+            fields="replies.addSheet.properties.sheetId",
+        )
         .execute
     )
 
-    sheet_id = response["replies"][0]["addSheet"]["properties"]["sheetId"]
+    # Replies come back in request order, one per addSheet
+    created = [
+        f"'{name}' (ID: {reply['addSheet']['properties']['sheetId']})"
+        for name, reply in zip(names, response["replies"])
+    ]
 
-    text_output = (
-        f"Successfully created sheet '{sheet_name}' (ID: {sheet_id}) in spreadsheet {spreadsheet_id} for {user_google_email}."
-    )
+    if len(created) == 1:
+        text_output = (
+            f"Successfully created sheet {created[0]} in spreadsheet {spreadsheet_id} for {user_google_email}."
+        )
+    else:
+        text_output = (
+            f"Successfully created {len(created)} sheets in spreadsheet {spreadsheet_id} for {user_google_email}: "
+            + ", ".join(created)
+        )
 
-    logger.info(f"Successfully created sheet for {user_google_email}. Sheet ID: {sheet_id}")
+    logger.info("Successfully created %s sheets for %s.", len(created), user_google_email)
     return text_output
 
 
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import logging
 import os
 import sys
@@ -131,6 +132,13 @@ def main():
         safe_print(f"   {tool_icons[tool]} {tool.title()} - Google {tool.title()} API integration")
     safe_print("")
 
+    # Parse the enabled APIs' discovery documents now rather than on the first tool call
+    from auth.google_auth import warm_discovery_documents
+    from auth.service_decorator import SERVICE_CONFIGS
+    warm_discovery_documents(
+        [(SERVICE_CONFIGS[tool]["service"], SERVICE_CONFIGS[tool]["version"]) for tool in tools_to_import]
+    )
+
     safe_print(f"📊 Configuration Summary:")
     safe_print(f"   🔧 Tools Enabled: {len(tools_to_import)}/{len(tool_imports)}")
     safe_print(f"   🔑 Auth Method: OAuth 2.0 with PKCE")
@@ -170,6 +178,15 @@ def main():
             else:
                 safe_print("   ⚠️  Warning: Failed to start OAuth callback server")
 
+        # Use uvloop's event loop when it is installed (it doesn't support Windows)
+        if sys.platform != "win32":
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                safe_print("   ⚡ Using uvloop event loop")
+            except ImportError:
+                pass
+
         safe_print("   Ready for MCP connections!")
         safe_print("")
 